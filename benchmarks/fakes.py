@@ -0,0 +1,223 @@
+"""
+Offline stand-ins used by the benchmark harness: a scripted chat model,
+stubbed HTTP/Tavily backends and a callback handler that times graph nodes.
+"""
+import asyncio
+import json
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import RunnableLambda
+from pydantic import Field
+
+# Values used to fill required tool arguments
+TOOL_ARGUMENTS = {
+    "restaurant_name": "Sasou",
+    "restaurant_names": ["Sasou"],
+    "place_id": "stub-place-id",
+    "lat": 48.1374,
+    "lng": 11.5755,
+    "food_type": "sushi",
+    "min_price": 5,
+    "max_price": 20,
+}
+
+
+class ScriptedChatModel(BaseChatModel):
+    """
+    Deterministic chat model. With tools bound, its first reply after a user
+    message calls the scripted tools; after the tool results it answers with a
+    fixed, evaluator-friendly text. Structured outputs are built per schema.
+    The call counter is shared by all copies created through bind_tools.
+    """
+    latency: float = 0.0
+    tool_plan: List[str] = Field(default_factory=list)
+    answer: str = ("Sasou at Marienplatz 28 is a well rated sushi restaurant (4.5 stars) with nigiri from 4 € "
+                   "and maki sets around 14 €. It is open 11:30-22:00; the closest parking is 250 m away.")
+    plain_answer: Optional[str] = None  # answer when no tools are bound (search fallback), defaults to `answer`
+    bound_tools: Dict[str, List[str]] = Field(default_factory=dict)
+    counter: Dict[str, int] = Field(default_factory=lambda: {"calls": 0})
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        bound = {}
+        for tool in tools:
+            schema = tool.args_schema if isinstance(tool.args_schema, dict) else tool.args_schema.model_json_schema()
+            bound[tool.name] = schema.get("required", [])
+        return self.model_copy(update={"bound_tools": bound})
+
+    def with_structured_output(self, schema, **kwargs):
+        def build(_):
+            self.counter["calls"] += 1
+            return self._structured(schema)
+
+        async def abuild(_):
+            self.counter["calls"] += 1
+            await asyncio.sleep(self.latency)
+            return self._structured(schema)
+
+        return RunnableLambda(build, afunc=abuild)
+
+    def _structured(self, schema):
+        name = schema.__name__
+        if name == "Sections":
+            section = schema.model_fields["sections"].annotation.__args__[0]
+            return schema(sections=[
+                section(name=title, description=f"{title} of the restaurant")
+                for title in ("Overview", "Menu and prices", "Location and parking")
+            ])
+        if name == "StorageDecision":
+            return schema(should_store=True, message_to_store="User likes salmon nigiri",
+                          reason="preference", is_duplicate=False)
+        if name == "EvaluationResult":
+            return schema(result=True)
+        raise ValueError(f"No scripted structured output for {name}")
+
+    def _reply(self, messages) -> AIMessage:
+        self.counter["calls"] += 1
+        after_user = []
+        for message in reversed(messages):
+            if isinstance(message, HumanMessage):
+                break
+            after_user.append(message)
+        tools_done = any(isinstance(message, ToolMessage) for message in after_user)
+        planned = [name for name in self.tool_plan if name in self.bound_tools]
+        if planned and not tools_done:
+            return AIMessage(content="", tool_calls=[
+                {"name": name, "args": {arg: TOOL_ARGUMENTS[arg] for arg in self.bound_tools[name] if arg in TOOL_ARGUMENTS},
+                 "id": f"call_{index}"}
+                for index, name in enumerate(planned)
+            ])
+        if not self.bound_tools and self.plain_answer is not None:
+            return AIMessage(content=self.plain_answer)
+        return AIMessage(content=self.answer)
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+    def _chunks(self, message: AIMessage):
+        words = message.content.split(" ") if message.content else [""]
+        for index, word in enumerate(words):
+            tool_chunks = [
+                {"name": call["name"], "args": json.dumps(call["args"]), "id": call["id"], "index": position}
+                for position, call in enumerate(message.tool_calls)
+            ] if index == 0 else []
+            yield ChatGenerationChunk(message=AIMessageChunk(content=word if index == 0 else " " + word,
+                                                             tool_call_chunks=tool_chunks))
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.latency)
+        yield from self._chunks(self._reply(messages))
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self.latency)
+        for chunk in self._chunks(self._reply(messages)):
+            yield chunk
+
+
+def stub_place(place_id: str) -> Dict:
+    return {
+        "name": "Sasou",
+        "formatted_address": "Marienplatz 28, 80331 München",
+        "rating": 4.5,
+        "user_ratings_total": 1200,
+        "price_level": 2,
+        "opening_hours": {"weekday_text": ["Monday: 11:30 AM - 10:00 PM"]},
+        "formatted_phone_number": "089 123456",
+        "website": "https://example.com",
+        "reviews": [
+            {"author_name": f"Guest {index}", "rating": 5 - index % 2, "text": "Fresh fish, friendly staff.",
+             "relative_time_description": "a week ago", "time": 1700000000 + index}
+            for index in range(5)
+        ],
+        "geometry": {"location": {"lat": 48.1374, "lng": 11.5755}},
+    }
+
+
+class StubHTTP:
+    """
+    Canned responses for the async HTTP client (Google Places and Open-Meteo).
+    """
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    async def get_json(self, url: str, params: Optional[Dict] = None):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        params = params or {}
+        if "open-meteo" in url:
+            count = len(str(params.get("latitude", "0")).split(","))
+            results = [{"current_weather": {"temperature": 14.2, "windspeed": 8.1, "weathercode": 2}}] * count
+            return results if count > 1 else results[0]
+        if "place/details" in url:
+            return {"status": "OK", "result": stub_place(params.get("place_id", ""))}
+        if "place/nearbysearch" in url:
+            return {"status": "OK", "results": [{"name": f"Sushi {index}", "rating": 4.0} for index in range(5)]}
+        raise ValueError(f"No stub for {url}")
+
+
+class StubTavily:
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def search(self, query: str, max_results: int = 5, **kwargs) -> Dict:
+        self.calls += 1
+        time.sleep(self.latency)
+        return {"results": [
+            {"title": f"Result {index}", "url": f"https://example.com/{index}", "content": f"About {query}", "score": 1 - index / 10}
+            for index in range(max_results)
+        ]}
+
+
+class NodeTimer(BaseCallbackHandler):
+    """
+    Records the duration of every graph node (including nodes of nested
+    subgraphs, labelled parent/child) and counts model and tool calls.
+    """
+    run_inline = True
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.started: Dict[Any, tuple] = {}
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+        self.model_calls = 0
+        self.tool_calls = 0
+
+    def on_chain_start(self, serialized, inputs, *, run_id, metadata=None, **kwargs):
+        metadata = metadata or {}
+        name = kwargs.get("name")
+        if name and name == metadata.get("langgraph_node"):
+            namespace = metadata.get("langgraph_checkpoint_ns", "")
+            label = "/".join(part.split(":")[0] for part in namespace.split("|") if part) or name
+            self.started[run_id] = (label, time.perf_counter())
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        entry = self.started.pop(run_id, None)
+        if entry is not None:
+            self.durations[entry[0]].append(time.perf_counter() - entry[1])
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self.started.pop(run_id, None)
+
+    def on_chat_model_start(self, serialized, messages, **kwargs):
+        self.model_calls += 1
+
+    def on_tool_start(self, serialized, input_str, **kwargs):
+        self.tool_calls += 1
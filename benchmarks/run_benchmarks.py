@@ -0,0 +1,238 @@
+"""
+Offline benchmarks for the chat graphs (Basic Chatbot, Sushi, Agentic AI) and the
+orchestrator-worker report graph.
+
+Every graph runs against a scripted chat model, the real MCP tools over the
+in-process transport (MCP_TRANSPORT=inprocess), and stubbed Google Places / Open-Meteo / Tavily backends, so runs
+are reproducible without network access or API keys. Reports end-to-end latency
+(p50/p95), per-node latency, model/tool/HTTP calls per turn and allocations.
+
+Usage:
+    python benchmarks/run_benchmarks.py --turns 20 --warmup 2
+    python benchmarks/run_benchmarks.py --llm-latency 0.05 --json benchmarks/results.json
+
+Warm-up turns fill the places/weather/web-search caches; use --warmup 0 to include
+the cold first turn. Parallel nodes (report section workers) report their summed time.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from statistics import mean
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+sys.path.append(str(current_file.parent))
+
+# Everything the graphs persist goes to a throw-away directory, and nothing may reach the network
+WORKDIR = Path(tempfile.mkdtemp(prefix="langgraph-bench-"))
+os.environ.update({
+    "GROQ_API_KEY": "offline",
+    "GEMINI_API_KEY": "offline",
+    "OPENAI_API_KEY": "offline",
+    "TAVILY_API_KEY": "offline",
+    "GOOGLE_MAP_API": "offline",
+    "EMBEDDING_BACKEND": "hashing",
+    "EMBEDDING_CACHE_PATH": str(WORKDIR / "embeddings.sqlite"),
+    "PLACES_CACHE_PATH": str(WORKDIR / "places.sqlite"),
+    "WEB_SEARCH_CACHE_PATH": str(WORKDIR / "web_search.sqlite"),
+    "ANSWER_CACHE_PATH": str(WORKDIR / "answers.sqlite"),
+    "LANGCHAIN_TRACING_V2": "false",
+    "LANGSMITH_TRACING": "false",
+    "MCP_TRANSPORT": "inprocess",
+})
+
+from langchain_core.messages import HumanMessage
+
+from fakes import NodeTimer, ScriptedChatModel, StubHTTP, StubTavily
+from src.langgraphagenticai import orchestrator
+from src.langgraphagenticai.batch_reports import percentile
+from src.langgraphagenticai.graph.graph_builder import GraphBuilder
+from src.langgraphagenticai.memory.background_store import get_background_store
+from src.langgraphagenticai.tools import web_search
+from src.langgraphagenticai.tools.http_client import get_http_client
+from src.langgraphagenticai.utils.event_loop import run_async
+
+USER_CONTROLS = {"selected_llm": "Groq", "selected_groq_model": "scripted"}
+REFUSAL = "I'm sorry, I don't have information about that."
+
+
+class Scenario(NamedTuple):
+    name: str
+    build: Callable  # model -> compiled graph
+    state: Callable  # () -> initial graph state
+    tool_plan: List[str]
+    answer: Optional[str] = None  # overrides the scripted answer after tool calls
+    plain_answer: Optional[str] = None  # answer of calls without tools
+
+
+def chat_graph(usecase: str) -> Callable:
+    return lambda model: GraphBuilder(model, USER_CONTROLS, "").setup_graph(usecase)
+
+
+def report_graph(model):
+    orchestrator.llm = model
+    orchestrator._section_agent = None
+    return orchestrator.orchestrator_worker
+
+
+def question(text: str) -> Callable:
+    return lambda: {"messages": [HumanMessage(content=text)]}
+
+
+SCENARIOS = [
+    Scenario("Basic Chatbot", chat_graph("Basic Chatbot"), question("Tell me something about sushi in Munich"), []),
+    Scenario("Sushi", chat_graph("Sushi"), question("How are the reviews of Sasou and where can I park nearby?"),
+             ["get_restaurant_data", "get_googlereviews", "get_parking_near_restaurant"]),
+    Scenario("Agentic AI", chat_graph("Agentic AI"), question("What is on the menu at Sasou and how is the weather there?"),
+             ["get_restaurant_menu", "get_weather"]),
+    Scenario("Agentic AI (search fallback)", chat_graph("Agentic AI"), question("Does Sasou have a vegan tasting menu?"),
+             ["get_restaurant_menu"], answer=REFUSAL,
+             plain_answer="Sasou offers vegan maki and an avocado nigiri plate for 16 € according to its website."),
+    Scenario("Report", report_graph,
+             lambda: {"topic": "Create a report about the restaurant Sasou in Munich", "report_name": "benchmark_report"},
+             []),
+]
+
+
+class Backends:
+    """Installs the HTTP/Tavily stubs."""
+    def __init__(self, http_latency: float):
+        self.http = StubHTTP(http_latency)
+        self.tavily = StubTavily(http_latency)
+        get_http_client().get_json = self.http.get_json
+        web_search.get_tavily_client = lambda: self.tavily
+
+    def reset(self):
+        self.http.calls = 0
+        self.tavily.calls = 0
+
+
+def run_turn(graph, state: Dict, timer: NodeTimer, verbose: bool) -> float:
+    """Run one turn and return its latency; background memory writes are drained but not timed."""
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with output:
+        started = time.perf_counter()
+        run_async(graph.ainvoke(state, config={"callbacks": [timer]}))
+        seconds = time.perf_counter() - started
+        get_background_store().drain()
+    return seconds
+
+
+def bench_scenario(scenario: Scenario, backends: Backends, args) -> Dict:
+    model = ScriptedChatModel(latency=args.llm_latency, tool_plan=scenario.tool_plan, plain_answer=scenario.plain_answer)
+    if scenario.answer:
+        model.answer = scenario.answer
+    graph = scenario.build(model)
+    timer = NodeTimer()
+
+    for _ in range(args.warmup):
+        run_turn(graph, scenario.state(), timer, args.verbose)
+
+    latencies = []
+    nodes = defaultdict(list)
+    calls = defaultdict(list)
+    for _ in range(args.turns):
+        timer.reset()
+        backends.reset()
+        model.counter["calls"] = 0
+        latencies.append(run_turn(graph, scenario.state(), timer, args.verbose))
+        for label, durations in timer.durations.items():
+            nodes[label].append(sum(durations))
+        calls["llm"].append(model.counter["calls"])
+        calls["tools"].append(timer.tool_calls)
+        calls["http"].append(backends.http.calls)
+        calls["web_search"].append(backends.tavily.calls)
+
+    # Allocation pass, separate because tracemalloc slows everything down
+    peaks, retained = [], []
+    tracemalloc.start()
+    for _ in range(args.alloc_turns):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        run_turn(graph, scenario.state(), timer, args.verbose)
+        current, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+        retained.append(current - before)
+    tracemalloc.stop()
+
+    return {
+        "turns": args.turns,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.5) * 1000, 2),
+            "p95": round(percentile(latencies, 0.95) * 1000, 2),
+            "mean": round(mean(latencies) * 1000, 2),
+        },
+        # Mean time per turn spent in each node; nested agent nodes are labelled parent/child
+        "nodes_ms": {label: round(mean(values + [0.0] * (args.turns - len(values))) * 1000, 2)
+                     for label, values in sorted(nodes.items())},
+        "calls_per_turn": {kind: round(mean(values), 2) for kind, values in calls.items()},
+        "alloc_kib": {
+            "peak": round(mean(peaks) / 1024, 1) if peaks else None,
+            "retained": round(mean(retained) / 1024, 1) if retained else None,
+        },
+    }
+
+
+def print_report(results: Dict):
+    for name, result in results.items():
+        latency = result["latency_ms"]
+        calls = result["calls_per_turn"]
+        alloc = result["alloc_kib"]
+        print(f"\n{name} ({result['turns']} turns)")
+        print(f"  end-to-end   p50 {latency['p50']:.2f} ms  p95 {latency['p95']:.2f} ms  mean {latency['mean']:.2f} ms")
+        print("  per turn     " + "  ".join(f"{kind} {value:g}" for kind, value in calls.items()))
+        if alloc["peak"] is not None:
+            print(f"  allocations  peak {alloc['peak']:.1f} KiB  retained {alloc['retained']:.1f} KiB")
+        print("  nodes (mean ms per turn)")
+        for label, value in result["nodes_ms"].items():
+            print(f"    {label:<32} {value:8.2f}")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Offline benchmarks of the LangGraph use cases")
+    parser.add_argument("--turns", type=int, default=20, help="Measured turns per scenario")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured turns first (fills caches, compiles agents)")
+    parser.add_argument("--alloc-turns", type=int, default=3, help="Turns measured under tracemalloc (0 to skip)")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Simulated seconds per model call")
+    parser.add_argument("--http-latency", type=float, default=0.0, help="Simulated seconds per HTTP/Tavily call")
+    parser.add_argument("--scenario", action="append", help="Only these scenarios (repeatable)")
+    parser.add_argument("--json", help="Also write the results to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show the graphs' own output")
+    args = parser.parse_args(argv)
+
+    json_path = Path(args.json).resolve() if args.json else None
+    scenarios = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+    if not scenarios:
+        parser.error(f"unknown scenario, choose from: {', '.join(s.name for s in SCENARIOS)}")
+
+    cwd = os.getcwd()
+    # Chroma and the exported reports use relative paths
+    os.chdir(WORKDIR)
+    try:
+        backends = Backends(args.http_latency)
+        results = {scenario.name: bench_scenario(scenario, backends, args) for scenario in scenarios}
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    print_report(results)
+    if json_path:
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nResults written to {json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
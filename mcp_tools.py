@@ -1,7 +1,8 @@
 from mcp.server.fastmcp import FastMCP
-from src.langgraphagenticai.tools.google_map_review import get_reviews_for_restaurant
-from src.langgraphagenticai.tools.weather_info import get_weather_for_restaurant
-from src.langgraphagenticai.tools.google_map_review import get_place_details_by_id
+from src.langgraphagenticai.tools.google_map_review import aget_reviews_for_restaurant
+from src.langgraphagenticai.tools.weather_info import aget_weather_for_restaurant
+from src.langgraphagenticai.tools.weather_info import aget_weather_for_restaurants
+from src.langgraphagenticai.tools.google_map_review import aget_place_details_by_id
 import json
 import requests
 from typing import List, Dict, Optional
@@ -10,7 +11,7 @@ from typing import List, Dict, Optional
 mcp=FastMCP("Get restaurant, parking, weather, reviews", port=8000)
 
 @mcp.tool()
-def get_reviews(restaurant_name: str) -> dict:
+async def get_reviews(restaurant_name: str) -> dict:
     """
     Get the latest Google reviews for the given restaurant name.
     Args:
@@ -19,7 +20,7 @@ def get_reviews(restaurant_name: str) -> dict:
         dict: The reviews for the given restaurant name.
     """
     try:
-        result = get_reviews_for_restaurant(restaurant_name)
+        result = await aget_reviews_for_restaurant(restaurant_name)
         if result is None:
             return {"error": f"Could not find reviews for {restaurant_name}"}
         return result
@@ -27,7 +28,7 @@ def get_reviews(restaurant_name: str) -> dict:
         return {"error": str(e)}
 
 @mcp.tool()
-def get_place_details(place_id: str) -> dict:
+async def get_place_details(place_id: str) -> dict:
     """
     Get detailed information about a place using Google Places API.
     Args:
@@ -36,12 +37,12 @@ def get_place_details(place_id: str) -> dict:
         dict: Detailed place information including reviews
     """
     try:
-        return get_place_details_by_id(place_id)
+        return await aget_place_details_by_id(place_id)
     except Exception as e:
         return {"error": str(e)}
 
 @mcp.tool()
-def search_nearby_restaurants(lat: float, lng: float, radius: int = 1000) -> dict:
+async def search_nearby_restaurants(lat: float, lng: float, radius: int = 1000) -> dict:
     """
     Search for restaurants near a specific location.
     Args:
@@ -52,13 +53,13 @@ def search_nearby_restaurants(lat: float, lng: float, radius: int = 1000) -> dic
         dict: List of nearby restaurants
     """
     try:
-        from src.langgraphagenticai.tools.google_map_review import search_nearby_places
-        return search_nearby_places(lat, lng, radius, "restaurant")
+        from src.langgraphagenticai.tools.google_map_review import asearch_nearby_places
+        return await asearch_nearby_places(lat, lng, radius, "restaurant")
     except Exception as e:
         return {"error": str(e)}
 
 @mcp.tool()
-def get_weather(restaurant_name: str) -> dict:
+async def get_weather(restaurant_name: str) -> dict:
     """
     Fetch weather or climate for a given restaurant.
     Args:
@@ -67,7 +68,24 @@ def get_weather(restaurant_name: str) -> dict:
         Optional[Dict]: The weather for the given restaurant.
     """
     try:
-        return get_weather_for_restaurant(restaurant_name)
+        return await aget_weather_for_restaurant(restaurant_name)
+    except Exception as e:
+        return {"error": str(e)}
+
+@mcp.tool()
+async def get_weather_for_multiple_restaurants(restaurant_names: Optional[List[str]] = None) -> dict:
+    """
+    Fetch the current weather for several restaurants at once, e.g. to compare them.
+    Args:
+        restaurant_names (List[str]): The restaurant names; leave empty for all restaurants.
+    Returns:
+        dict: The current weather for each restaurant, or an error entry for names that were not found.
+    """
+    try:
+        result = await aget_weather_for_restaurants(restaurant_names)
+        if result is None:
+            return {"error": "Could not fetch weather"}
+        return result
     except Exception as e:
         return {"error": str(e)}
 
@@ -2,6 +2,7 @@ from .openAIllm import OpenAILLM
 from .geminillm import GeminiLLM
 from .ollamallm import OllamaLLM
 from .groqllm import GroqLLM
+from .client_registry import LLMClientRegistry, get_llm_client_registry
 
-__all__ = ["OpenAILLM", "GeminiLLM", "OllamaLLM", "GroqLLM"]
+__all__ = ["OpenAILLM", "GeminiLLM", "OllamaLLM", "GroqLLM", "LLMClientRegistry", "get_llm_client_registry"]
 
@@ -0,0 +1,65 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+class LLMClientRegistry:
+    """
+    Process-wide, LRU-bounded pool of chat model clients.
+    Clients are keyed by (provider, model, credentials hash) so every Streamlit
+    rerun and session using the same configuration shares one client and its
+    HTTP keep-alive/TLS connections.
+    """
+    def __init__(self, max_size: int = 16):
+        self.max_size = max_size
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def credentials_hash(credentials: Any) -> str:
+        """Hash the credentials so raw API keys are never used as dict keys."""
+        payload = json.dumps(credentials, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_or_create(self, provider: str, model: str, credentials: Any, factory: Callable[[], Any]) -> Any:
+        """
+        Return the pooled client for this configuration, creating it with factory() on a miss.
+        """
+        key = (provider, model, self.credentials_hash(credentials))
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+
+            client = factory()
+            self._clients[key] = client
+            # Evict the least recently used clients beyond the bound
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+            return client
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_llm_client_registry() -> LLMClientRegistry:
+    """
+    Return the process-wide LLM client registry.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = LLMClientRegistry()
+    return _registry
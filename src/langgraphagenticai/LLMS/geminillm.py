@@ -4,6 +4,7 @@ import os
 # from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_community.chat_message_histories import ChatMessageHistory
+from .client_registry import get_llm_client_registry
 import dotenv
 dotenv.load_dotenv()
 
@@ -24,7 +25,10 @@ class GeminiLLM:
         """Return the base Gemini LLM instance"""
         gemini_api_key = self.user_controls_input["GEMINI_API_KEY"]
         selected_gemini_model = self.user_controls_input["selected_gemini_model"]
-        return ChatGoogleGenerativeAI(api_key=gemini_api_key, model=selected_gemini_model)
+        return get_llm_client_registry().get_or_create(
+            "Gemini", selected_gemini_model, gemini_api_key,
+            lambda: ChatGoogleGenerativeAI(api_key=gemini_api_key, model=selected_gemini_model)
+        )
 
 if __name__ == "__main__":
     # Example usage
@@ -1,6 +1,7 @@
 import os
 from langchain_groq import ChatGroq
 from langchain_community.chat_message_histories import ChatMessageHistory
+from .client_registry import get_llm_client_registry
 import dotenv
 dotenv.load_dotenv()
 
@@ -22,7 +23,10 @@ class GroqLLM:
         """Return the base ChatGroq LLM instance"""
         groq_api_key = self.user_controls_input["GROQ_API_KEY"]
         selected_groq_model = self.user_controls_input["selected_groq_model"]
-        return ChatGroq(api_key=groq_api_key, model=selected_groq_model)
+        return get_llm_client_registry().get_or_create(
+            "Groq", selected_groq_model, groq_api_key,
+            lambda: ChatGroq(api_key=groq_api_key, model=selected_groq_model)
+        )
 
 if __name__ == "__main__":
     # Example usage
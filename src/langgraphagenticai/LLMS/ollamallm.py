@@ -1,6 +1,7 @@
 import os
 from langchain_ollama import ChatOllama
 from langchain_community.chat_message_histories import ChatMessageHistory
+from .client_registry import get_llm_client_registry
 import dotenv
 dotenv.load_dotenv()
 
@@ -21,7 +22,10 @@ class OllamaLLM:
         """Return the base Ollama LLM instance"""
         selected_ollama_model = self.user_controls_input["selected_ollama_model"]
         ollama_base_url = self.user_controls_input.get("OLLAMA_BASE_URL", "http://localhost:11434")
-        return ChatOllama(model=selected_ollama_model, base_url=ollama_base_url)
+        return get_llm_client_registry().get_or_create(
+            "Ollama", selected_ollama_model, ollama_base_url,
+            lambda: ChatOllama(model=selected_ollama_model, base_url=ollama_base_url)
+        )
 
 if __name__ == "__main__":
     # Example usage
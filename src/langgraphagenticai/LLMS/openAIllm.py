@@ -1,6 +1,7 @@
 import os
 from langchain_openai import ChatOpenAI
 from langchain_community.chat_message_histories import ChatMessageHistory
+from .client_registry import get_llm_client_registry
 import dotenv
 dotenv.load_dotenv()
 
@@ -23,7 +24,10 @@ class OpenAILLM:
         """Return the base ChatOpenAI LLM instance """
         openai_api_key = self.user_controls_input.get("OPENAI_API_KEY", "")
         selected_openai_model = self.user_controls_input.get("selected_openai_model", "gpt-4.1-mini")
-        return ChatOpenAI(api_key=openai_api_key, model=selected_openai_model)
+        return get_llm_client_registry().get_or_create(
+            "OpenAI", selected_openai_model, openai_api_key,
+            lambda: ChatOpenAI(api_key=openai_api_key, model=selected_openai_model)
+        )
 
 
 if __name__ == "__main__":
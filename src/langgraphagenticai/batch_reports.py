@@ -0,0 +1,205 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.append(str(project_root))
+from src.langgraphagenticai.orchestrator import orchestrator_worker
+from src.langgraphagenticai.tools.restaurant_catalog import get_restaurant_catalog
+from src.langgraphagenticai.utils.metrics import metrics_callbacks, start_metrics_server
+
+REPORTS_DIR = Path("reports")
+MANIFEST_FILE = REPORTS_DIR / "batch_manifest.json"
+
+
+def slugify(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_") or "restaurant"
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """Best-effort detection of HTTP 429 / rate-limit errors across the LLM SDKs."""
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    text = str(error).lower()
+    return "429" in text or "rate limit" in text or "rate_limit" in text or "too many requests" in text
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Retry-After header of the failed response, if the SDK exposes it."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitGate:
+    """
+    Shared cool-down: when one report hits a rate limit, no report starts a new
+    attempt until the back-off has passed, instead of every worker hammering the API.
+    """
+    def __init__(self):
+        self.resume_at = 0.0
+
+    async def wait(self):
+        delay = self.resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def back_off(self, seconds: float):
+        self.resume_at = max(self.resume_at, time.monotonic() + seconds)
+
+
+class Manifest:
+    """
+    Per-restaurant progress of a batch run, rewritten atomically after every report
+    so an interrupted or failed run can be resumed.
+    """
+    def __init__(self, path: Path, run_id: str):
+        self.path = path
+        self.run_id = run_id
+        self.entries: Dict[str, Dict] = {}
+        self._lock = asyncio.Lock()
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("run_id") == run_id:
+                self.entries = data.get("restaurants", {})
+
+    def is_done(self, name: str) -> bool:
+        entry = self.entries.get(name)
+        return bool(entry) and entry.get("status") == "done" and Path(entry.get("file", "")).exists()
+
+    async def record(self, name: str, **entry):
+        async with self._lock:
+            self.entries[name] = {**entry, "finished_at": datetime.now().isoformat(timespec="seconds")}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"run_id": self.run_id, "restaurants": self.entries}, indent=2), encoding="utf-8")
+            os.replace(tmp, self.path)
+
+    @staticmethod
+    def stored_run_id(path: Path) -> Optional[str]:
+        """run_id of an existing manifest, or None."""
+        try:
+            return json.loads(path.read_text(encoding="utf-8")).get("run_id")
+        except (OSError, ValueError):
+            return None
+
+
+async def generate_report(name: str, run_id: str, gate: RateLimitGate, max_retries: int) -> Dict:
+    """
+    Run the orchestrator-worker graph for one restaurant, backing off on rate limits.
+    """
+    attempt = 0
+    while True:
+        await gate.wait()
+        try:
+            state = await orchestrator_worker.ainvoke({
+                "topic": f"Create a report about the restaurant {name} in Munich",
+                "report_name": f"report_{slugify(name)}_{run_id}",
+            }, config={"callbacks": metrics_callbacks()})
+            return {"file": state["markdown_file"], "attempts": attempt + 1}
+        except Exception as e:
+            attempt += 1
+            if not is_rate_limited(e) or attempt > max_retries:
+                raise
+            delay = retry_after_seconds(e) or min(60.0, 2 ** attempt) + random.uniform(0, 1)
+            print(f"[{name}] rate limited, retrying in {delay:.1f}s (attempt {attempt}/{max_retries})")
+            gate.back_off(delay)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_batch(names: List[str], concurrency: int, resume: bool, max_retries: int, run_id: str) -> Dict:
+    """
+    Generate reports for the given restaurants with at most `concurrency` running at once.
+    Returns a summary with counts, throughput and latency percentiles.
+    """
+    manifest = Manifest(MANIFEST_FILE, run_id)
+    gate = RateLimitGate()
+    slots = asyncio.Semaphore(concurrency)
+    latencies = []
+    counts = {"done": 0, "failed": 0, "skipped": 0}
+
+    async def worker(name: str):
+        if resume and manifest.is_done(name):
+            counts["skipped"] += 1
+            return
+        async with slots:
+            started = time.perf_counter()
+            try:
+                result = await generate_report(name, run_id, gate, max_retries)
+            except Exception as e:
+                seconds = time.perf_counter() - started
+                counts["failed"] += 1
+                print(f"[{name}] failed after {seconds:.1f}s: {e!r}")
+                await manifest.record(name, status="failed", error=repr(e), seconds=round(seconds, 2))
+                return
+            seconds = time.perf_counter() - started
+            latencies.append(seconds)
+            counts["done"] += 1
+            print(f"[{name}] done in {seconds:.1f}s -> {result['file']}")
+            await manifest.record(name, status="done", seconds=round(seconds, 2), **result)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker(name) for name in names])
+    wall = time.perf_counter() - started
+
+    summary = {**counts, "total": len(names), "wall_seconds": round(wall, 2)}
+    summary["reports_per_minute"] = round(counts["done"] / wall * 60, 2) if wall > 0 else 0.0
+    if latencies:
+        summary.update({
+            "latency_p50": round(percentile(latencies, 0.5), 2),
+            "latency_p95": round(percentile(latencies, 0.95), 2),
+            "latency_max": round(max(latencies), 2),
+        })
+    return summary
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Generate reports for every restaurant in data/sushi.json")
+    parser.add_argument("--concurrency", type=int, default=int(os.getenv("BATCH_CONCURRENCY", 2)),
+                        help="Reports generated at the same time")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip restaurants already reported in this run (see reports/batch_manifest.json)")
+    parser.add_argument("--run-id",
+                        help="Run identifier used in file names and for resuming "
+                             "(default: the manifest's run with --resume, else today)")
+    parser.add_argument("--max-retries", type=int, default=4, help="Retries per report on rate limits")
+    parser.add_argument("--restaurant", action="append", help="Only these restaurants (repeatable)")
+    parser.add_argument("--limit", type=int, help="Only the first N restaurants")
+    parser.add_argument("--metrics-port", type=int, default=int(os.getenv("METRICS_PORT", 0)),
+                        help="Serve Prometheus metrics on this port while the batch runs (0: off)")
+    args = parser.parse_args(argv)
+    if args.run_id is None:
+        # Resuming after midnight must continue the stored run, not start today's
+        args.run_id = (args.resume and Manifest.stored_run_id(MANIFEST_FILE)) or datetime.now().strftime("%Y%m%d")
+    start_metrics_server(args.metrics_port)
+
+    names = args.restaurant or get_restaurant_catalog().names()
+    if args.limit:
+        names = names[:args.limit]
+
+    summary = asyncio.run(run_batch(names, args.concurrency, args.resume, args.max_retries, args.run_id))
+    print("\nBatch summary:")
+    for key, value in summary.items():
+        print(f"  {key}: {value}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,10 +2,20 @@ from langgraph.graph import StateGraph
 from src.langgraphagenticai.state.state import State
 from langgraph.graph import START,END
 from src.langgraphagenticai.nodes.basic_chatbot_node import BasicChatbotNode,RestaurantRecommendationNode
-import asyncio
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
 from dotenv import load_dotenv
 load_dotenv()
 
+# Compiled graphs shared across messages and sessions: (usecase, provider, model) -> (config fingerprint, graph).
+# LRU-bounded like the LLM client registry, since every graph keeps its client alive
+_compiled_graphs = OrderedDict()
+_compiled_graphs_lock = threading.Lock()
+MAX_COMPILED_GRAPHS = int(os.getenv("GRAPH_CACHE_SIZE", 16))
+
 class GraphBuilder:
     def __init__(self,model,user_controls_input,message):
         self.llm=model
@@ -33,7 +43,7 @@ class GraphBuilder:
         """
         self.restaurant_recommendation_node = RestaurantRecommendationNode(self.llm)
 
-        self.graph_builder.add_node("restaurant_node", self.restaurant_recommendation_node.restaurant_node_sync)
+        self.graph_builder.add_node("restaurant_node", self.restaurant_recommendation_node.restaurant_node)
         self.graph_builder.add_edge(START, "restaurant_node")
         self.graph_builder.add_edge("restaurant_node", END)
         
@@ -41,10 +51,13 @@ class GraphBuilder:
     def assistant_chatbot_build_graph(self):
         """
         Builds a assistant chatbot graph using LangGraph.
+        With MEMORY_STORE_MODE=background (default) store_node only queues the memory
+        update, so the answer is returned as soon as evaluation/search are done.
         """
-        self.restaurant_recommendation_node = RestaurantRecommendationNode(self.llm)
+        background_store = os.getenv("MEMORY_STORE_MODE", "background").lower() == "background"
+        self.restaurant_recommendation_node = RestaurantRecommendationNode(self.llm, background_store=background_store)
 
-        self.graph_builder.add_node("chatbot", self.restaurant_recommendation_node.process_sync)
+        self.graph_builder.add_node("chatbot", self.restaurant_recommendation_node.process)
         self.graph_builder.add_node("evaluate_node", self.restaurant_recommendation_node.evaluate_node)
         self.graph_builder.add_node("store_node", self.restaurant_recommendation_node.store_node)
         self.graph_builder.add_node("search_node", self.restaurant_recommendation_node.search_node)
@@ -86,3 +99,52 @@ class GraphBuilder:
            self.basic_chatbot_build_graph()
 
         return self.graph_builder.compile()
+
+    def cache_key(self, usecase: str) -> tuple:
+        """
+        Key of the compiled graph for this use case, provider and model. The model is
+        read from the client the graph binds, so the key (and the answer-cache scope
+        built from it) always names the model that actually answers.
+        """
+        provider = self.current_llm
+        model = (getattr(self.llm, "model_name", None) or getattr(self.llm, "model", None)
+                 or self.user_controls_input.get(f"selected_{str(provider).lower()}_model"))
+        return (usecase, provider, str(model))
+
+    def config_fingerprint(self) -> str:
+        """
+        Hash of the user controls (model, credentials, options) and of the model client
+        the graph binds; a change invalidates the cached graph.
+        """
+        payload = json.dumps([self.user_controls_input, id(self.llm)], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_graph(self, usecase: str):
+        """
+        Returns the compiled graph for the use case, building it only on the first
+        request or after the configuration changed.
+        """
+        key = self.cache_key(usecase)
+        fingerprint = self.config_fingerprint()
+        with _compiled_graphs_lock:
+            cached = _compiled_graphs.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                _compiled_graphs.move_to_end(key)
+                return cached[1]
+            graph = self.setup_graph(usecase)
+            _compiled_graphs[key] = (fingerprint, graph)
+            _compiled_graphs.move_to_end(key)
+            # Evict the least recently used graphs (and the clients they hold) beyond the bound
+            while len(_compiled_graphs) > MAX_COMPILED_GRAPHS:
+                _compiled_graphs.popitem(last=False)
+            return graph
+
+    @staticmethod
+    def invalidate_graph_cache(usecase: str = None, provider: str = None):
+        """
+        Drops cached graphs, optionally only those of one use case and/or provider.
+        """
+        with _compiled_graphs_lock:
+            for key in list(_compiled_graphs):
+                if (usecase is None or key[0] == usecase) and (provider is None or key[1] == provider):
+                    del _compiled_graphs[key]
@@ -1,5 +1,5 @@
 import streamlit as st
-import asyncio
+import time
 from src.langgraphagenticai.ui.streamlitui.loadui import LoadStreamlitUI
 from src.langgraphagenticai.LLMS.groqllm import GroqLLM
 from src.langgraphagenticai.LLMS.ollamallm import OllamaLLM
@@ -8,12 +8,85 @@ from src.langgraphagenticai.LLMS.openAIllm import OpenAILLM
 from src.langgraphagenticai.graph.graph_builder import GraphBuilder
 from langchain_core.messages import HumanMessage, AIMessage
 from src.langgraphagenticai.tools.return_prompt import return_prompt
+from src.langgraphagenticai.utils.event_loop import run_async, iterate_async
+from src.langgraphagenticai.utils.streaming import astream_graph
+from src.langgraphagenticai.memory.answer_cache import get_answer_cache
+from src.langgraphagenticai.memory.chat_history import ChatHistoryManager, llm_summarizer
+from src.langgraphagenticai.utils.metrics import start_metrics_server, metrics_callbacks, TURN_LATENCY
+
+#Use cases whose answers depend only on the question and the restaurant/parking data.
+#Agentic AI is excluded: its prompt carries the user's stored memories and the conversation,
+#and a cached reply would also skip its store_node memory write.
+ANSWER_CACHE_USECASES = ("Sushi",)
 
 def extract_content(val):
     if isinstance(val, (HumanMessage, AIMessage)):
         return val.content
     return val
 
+def get_history_manager(config, provider, model, llm):
+    """
+    Returns the session's token-budgeted history, adjusting the budget and
+    summarizer when the provider or model changes.
+    """
+    if 'history_manager' not in st.session_state:
+        st.session_state['history_manager'] = ChatHistoryManager(
+            max_messages=int(config.get_chat_history_length()),
+            summary_budget=config.get_history_summary_tokens()
+        )
+        st.session_state['history_manager'].load(
+            [{"role": msg["role"], "content": extract_content(msg["content"])} for msg in st.session_state.get('chat_history', [])]
+        )
+    history = st.session_state['history_manager']
+    history.token_budget = config.get_history_token_budget(provider, model)
+    history.summarizer = llm_summarizer(llm)
+    return history
+
+def render_message(msg):
+    """
+    Renders one chat history entry in the Streamlit chat.
+    """
+    with st.chat_message(msg["role"]):
+        content = msg["content"]
+        if isinstance(content, dict) and "content" in content:
+            st.write(content["content"])
+        elif isinstance(content, (HumanMessage, AIMessage)):
+            st.write(content.content)
+        elif isinstance(content, str):
+            st.write(content)
+        else:
+            st.write(str(content))
+
+def stream_graph_reply(graph, initial_state, config):
+    """
+    Runs the graph in streaming mode, rendering answer tokens and tool progress
+    in the assistant bubble as they arrive. Returns the final graph state.
+    """
+    with st.chat_message("assistant"):
+        status = st.empty()
+        placeholder = st.empty()
+        answer_run, answer = None, ""
+        final_state = None
+        for update in iterate_async(astream_graph(graph, initial_state, config)):
+            if update.kind == "token":
+                # A new model call (next ReAct step, or a web-search retry) replaces the text shown so far
+                if update.run_id != answer_run:
+                    answer_run, answer = update.run_id, ""
+                answer += update.text
+                placeholder.markdown(answer + "▌")
+            elif update.kind == "tool_start":
+                status.caption(f"🔧 Calling `{update.text}`…")
+            elif update.kind == "tool_end":
+                status.caption(f"✅ `{update.text}` finished")
+            elif update.kind == "node":
+                status.caption(f"⏳ {update.text.replace('_', ' ')}…")
+            elif update.kind == "final":
+                final_state = update.state
+        status.empty()
+        if final_state is not None:
+            placeholder.markdown(extract_content(final_state["messages"][-1]))
+        return final_state
+
 def load_langgraph_agenticai_app():
     """
     Loads and runs the LangGraph AgenticAI application with Streamlit UI.
@@ -26,6 +99,8 @@ def load_langgraph_agenticai_app():
     ##Load UI
     ui=LoadStreamlitUI()
     user_input=ui.load_streamlit_ui()
+    #Serves /metrics when METRICS_PORT is set; only the first rerun starts the endpoint
+    start_metrics_server(ui.config.get_metrics_port())
 
     if not user_input: #This is the user input from the UI if no user input is found then error is shown
         st.error("Error: Failed to load user input from the UI.")
@@ -43,11 +118,13 @@ def load_langgraph_agenticai_app():
 
     # Initialize or get existing LLM config object to maintain chat history
     current_llm = user_input["selected_llm"]
+    current_model = user_input.get(f"selected_{current_llm.lower()}_model")
     #print(user_message)
-    # Check if we need to create a new LLM config (first time or LLM changed)
+    # Check if we need to create a new LLM config (first time, LLM or model changed)
     if ('llm_config' not in st.session_state or
         'current_llm_type' not in st.session_state or
-        st.session_state['current_llm_type'] != current_llm):
+        st.session_state['current_llm_type'] != current_llm or
+        st.session_state.get('current_llm_model') != current_model):
 
         try:
             ## Configure The LLM's with chat history support
@@ -67,8 +144,9 @@ def load_langgraph_agenticai_app():
                 st.session_state['llm_config'] = OllamaLLM(user_controls_input=user_input)
                 base_llm = st.session_state['llm_config'].get_base_llm()
 
-            # Store the current LLM type
+            # Store the current LLM type and model
             st.session_state['current_llm_type'] = current_llm
+            st.session_state['current_llm_model'] = current_model
 
 
 
@@ -78,6 +156,7 @@ def load_langgraph_agenticai_app():
     else:
         base_llm = st.session_state['llm_config'].get_base_llm()
 
+    streamed = False #Set once the streaming path has already rendered this turn
     if user_message:
         try:
             #History
@@ -86,46 +165,71 @@ def load_langgraph_agenticai_app():
             if not usecase:
                 st.error("Error: No use case selected.")
                 return
-            # Prepare the initial state with full chat history (for context)
+            # Prepare the initial state: system prompt, rolling summary and the history that fits the token budget
             system_prompt = return_prompt(usecase)
-            #Adding system prompt to the messages
-            messages = [{"role": "system", "content": system_prompt}]
-            #Adding previous responses from llm to the messages
-
-            # Add only the last 20 messages (or all if less than 20)
-            last_n_messages = st.session_state['chat_history'][-int(ui.config.get_chat_history_length()):] if len(st.session_state['chat_history']) > int(ui.config.get_chat_history_length()) else st.session_state['chat_history']
-            messages += [{"role": msg["role"], "content": extract_content(msg["content"])} for msg in last_n_messages]
-
-            #adding current user message to the messages
-            if(len(messages) > int(ui.config.get_chat_history_length())):
-                messages.pop(1)
-            messages.append({"role": "user", "content": user_message})
-
+            history = get_history_manager(ui.config, current_llm, current_model, base_llm)
+            messages = history.messages(system_prompt, user_message)
 
             #initial state is the messages
             initial_state = {"messages": messages}
 
-            #Building the graph
+            #Compiled graphs are cached per (use case, provider, model) and reused across messages
             graph_builder = GraphBuilder(model=base_llm,user_controls_input=user_input,message=user_message)
-            graph = graph_builder.setup_graph(usecase)
-
-            # Run the graph (async, since RestaurantRecommendationNode is async)
-            result = asyncio.run(graph.ainvoke(initial_state, config={"configurable": {"session_id": st.session_state['session_id']}}))
-            # Get the assistant's reply robustly
-            assistant_reply = ""
-            if isinstance(result["messages"], list):
-                last_message = result["messages"][-1] if result["messages"] else ""
-                if isinstance(last_message, dict):
-                    assistant_reply = last_message.get("content", "")
-                else:
-                    assistant_reply = last_message
-            elif isinstance(result["messages"], dict):
-                assistant_reply = result["messages"].get("content", "")
+            graph = graph_builder.get_graph(usecase)
+
+            #metrics_callbacks() records node, LLM and tool latency and token usage when metrics are enabled
+            graph_config = {"configurable": {"session_id": st.session_state['session_id']}, "callbacks": metrics_callbacks()}
+            turn_started = time.perf_counter()
+            #Repeat questions are answered from the answer cache without any LLM or tool call
+            answer_cache = get_answer_cache() if usecase in ANSWER_CACHE_USECASES and ui.config.get_enable_answer_cache() else None
+            #Scoped on the model of base_llm, the client that produces the answer
+            cache_key = graph_builder.cache_key(usecase)
+            cached_reply = None
+            if answer_cache:
+                try:
+                    cached_reply = answer_cache.lookup(cache_key, user_message)
+                except Exception as e:
+                    print(f"Answer cache lookup failed: {e}")
+
+            if cached_reply is not None:
+                assistant_reply = cached_reply
             else:
-                assistant_reply = result["messages"]
+                # Run the graph on the shared background event loop so MCP sessions and HTTP pools survive reruns
+                if ui.config.get_enable_streaming():
+                    # Show the history and the new question right away, then stream the answer below them
+                    for msg in st.session_state['chat_history']:
+                        render_message(msg)
+                    render_message({"role": "user", "content": user_message})
+                    streamed = True
+                    result = stream_graph_reply(graph, initial_state, graph_config)
+                    if result is None:
+                        raise RuntimeError("Graph finished without a final state")
+                else:
+                    result = run_async(graph.ainvoke(initial_state, config=graph_config))
+                # Get the assistant's reply robustly
+                assistant_reply = ""
+                if isinstance(result["messages"], list):
+                    last_message = result["messages"][-1] if result["messages"] else ""
+                    if isinstance(last_message, dict):
+                        assistant_reply = last_message.get("content", "")
+                    else:
+                        assistant_reply = last_message
+                elif isinstance(result["messages"], dict):
+                    assistant_reply = result["messages"].get("content", "")
+                else:
+                    assistant_reply = result["messages"]
+                if answer_cache:
+                    try:
+                        answer_cache.store(cache_key, user_message, extract_content(assistant_reply))
+                    except Exception as e:
+                        print(f"Answer cache store failed: {e}")
+
+            TURN_LATENCY.observe(time.perf_counter() - turn_started, usecase=usecase, cached=str(cached_reply is not None).lower())
+
             # Append user and assistant messages to chat history
             st.session_state['chat_history'].append({"role": "user", "content": user_message})
             st.session_state['chat_history'].append({"role": "assistant", "content": assistant_reply})
+            history.add_turn(user_message, str(extract_content(assistant_reply)))
 
         except Exception as e:
             st.error(f"Error: Chat processing or graph execution failed - {e}")
@@ -133,21 +237,15 @@ def load_langgraph_agenticai_app():
 
     # Display the full chat history
 
-    for msg in st.session_state['chat_history']:
-        with st.chat_message(msg["role"]):
-            content = msg["content"]
-            if isinstance(content, dict) and "content" in content:
-                st.write(content["content"])
-            elif isinstance(content, (HumanMessage, AIMessage)):
-                st.write(content.content)
-            elif isinstance(content, str):
-                st.write(content)
-            else:
-                st.write(str(content))
+    if not streamed:
+        for msg in st.session_state['chat_history']:
+            render_message(msg)
 
     # Add a button to clear chat history
     if st.sidebar.button("Clear Chat History"):
         st.session_state['chat_history'] = []
+        if 'history_manager' in st.session_state:
+            st.session_state['history_manager'].clear()
         if 'llm_config' in st.session_state:
             st.session_state['llm_config'].clear_chat_history(st.session_state['session_id'])
         st.rerun()
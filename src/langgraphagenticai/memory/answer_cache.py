@@ -0,0 +1,198 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+
+from src.langgraphagenticai.memory.embeddings import normalize_text
+from src.langgraphagenticai.memory.vector_memory import get_vector_memory
+from src.langgraphagenticai.nodes.answer_evaluator import looks_like_refusal
+from src.langgraphagenticai.tools.parking_store import get_parking_store
+from src.langgraphagenticai.tools.restaurant_catalog import get_restaurant_catalog
+from src.langgraphagenticai.utils.metrics import registry
+
+DEFAULT_CACHE_PATH = "./.cache/answers.sqlite"
+
+# Question type -> TTL in seconds; the first matching type wins, so volatile data comes first
+QUESTION_TYPES = [
+    ("weather", r"\b(weather|temperature|rain|raining|sunny|cold|warm|forecast|wetter)\b", 10 * 60),
+    ("parking_live", r"\b(free|available|spots?|spaces?|open now|right now|currently)\b.*\bpark|\bpark\w*\b.*\b(free|available|spots?|spaces?|now)\b", 5 * 60),
+    ("reviews", r"\b(reviews?|ratings?|rated|stars?)\b", 6 * 3600),
+    ("parking", r"\bpark(ing)?\b|\bgarage\b", 24 * 3600),
+    ("catalog", r"\b(menu|price|prices|cost|cheap|expensive|address|phone|contact|website|list|which|available|restaurants?)\b", 24 * 3600),
+]
+DEFAULT_TTL = 3600
+
+# Questions whose answer depends on the conversation or on the user, never served from cache;
+# recommendations are personal too ("should I...", "best for us", "what do you suggest")
+_NOT_CACHEABLE_RE = re.compile(
+    r"\b(it|its|(?<!is )(?<!are )there|they|them|that one|this one|those|these|the same|above|previous|earlier|again|"
+    r"my|me|mine|i am|i'm|i like|i love|i prefer|remember|should i|we|us|our|ours|"
+    r"recommend\w*|suggest\w*|best for)\b",
+    re.IGNORECASE,
+)
+
+
+def question_type(question: str) -> tuple:
+    """Return (type name, ttl) for a question."""
+    text = normalize_text(question)
+    for name, pattern, ttl in QUESTION_TYPES:
+        if re.search(pattern, text):
+            return name, ttl
+    return "general", DEFAULT_TTL
+
+
+def _canonical(question: str) -> str:
+    return re.sub(r"[^\w\s]", "", normalize_text(question)).strip()
+
+
+def _entities(canonical_question: str) -> frozenset:
+    """Restaurant and parking names (from the catalog and parking data) mentioned in a canonical question."""
+    names = get_restaurant_catalog().names() + [lot.get("title") or "" for lot in get_parking_store().all()]
+    return frozenset(
+        name for name in names
+        if _canonical(name) and re.search(rf"\b{re.escape(_canonical(name))}\b", canonical_question)
+    )
+
+
+class AnswerCache:
+    """
+    Cache of final answers in front of the Sushi graph.
+    Entries are scoped to (use case, provider, model, sushi.json version,
+    parking.json version), so a model switch or a data edit never serves an
+    old answer. A question hits on an exact normalized match or on a stored
+    question whose embedding is at least `similarity` cosine-similar, of the
+    same type and naming the same restaurants and parking lots.
+    """
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, similarity: float = 0.92, embedding=None):
+        self.similarity = similarity
+        self._embedding = embedding
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.skipped = 0
+        registry.register_cache("answers", self)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS answers (scope TEXT NOT NULL, question TEXT NOT NULL, vector BLOB, "
+            "answer TEXT NOT NULL, question_type TEXT NOT NULL, stored_at REAL NOT NULL, ttl REAL NOT NULL, "
+            "PRIMARY KEY (scope, question))"
+        )
+        self._conn.commit()
+
+    @property
+    def embedding(self):
+        if self._embedding is None:
+            self._embedding = get_vector_memory().embedding
+        return self._embedding
+
+    def scope(self, graph_key: Sequence) -> str:
+        """
+        Cache scope for a graph key (use case, provider, model of the client that answers)
+        and the current data files.
+        """
+        parts = [str(part) for part in graph_key]
+        parts += [get_restaurant_catalog().version or "", get_parking_store().version or ""]
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+    def cacheable(self, question: str) -> bool:
+        return bool(_canonical(question)) and not _NOT_CACHEABLE_RE.search(question)
+
+    def _vector(self, question: str) -> np.ndarray:
+        vector = np.asarray(self.embedding.embed_query(_canonical(question)), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, graph_key: Sequence, question: str) -> Optional[str]:
+        """
+        Return a cached answer for the question, or None.
+        """
+        if not self.cacheable(question):
+            self.skipped += 1
+            return None
+
+        scope = self.scope(graph_key)
+        canonical = _canonical(question)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT answer FROM answers WHERE scope = ? AND question = ? AND stored_at + ttl > ?",
+                (scope, canonical, now)
+            ).fetchone()
+            if row is None:
+                candidates = self._conn.execute(
+                    "SELECT vector, answer, question_type, question FROM answers "
+                    "WHERE scope = ? AND stored_at + ttl > ? AND vector IS NOT NULL",
+                    (scope, now)
+                ).fetchall()
+        if row is not None:
+            self.hits += 1
+            return row[0]
+        if not candidates:
+            self.misses += 1
+            return None
+
+        query = self._vector(question)
+        matrix = np.stack([np.frombuffer(candidate[0], dtype=np.float32) for candidate in candidates])
+        scores = matrix @ query
+        best = int(np.argmax(scores))
+        # A similar wording must also be the same kind of question ("weather at X" vs "menu at X")
+        # about the same places ("menu at Sasou" vs "menu at Secret Garden")
+        if (scores[best] >= self.similarity and candidates[best][2] == question_type(question)[0]
+                and _entities(candidates[best][3]) == _entities(canonical)):
+            self.hits += 1
+            self.semantic_hits += 1
+            return candidates[best][1]
+        self.misses += 1
+        return None
+
+    def store(self, graph_key: Sequence, question: str, answer: str):
+        """
+        Cache an answer unless the question is conversational/personal or the answer
+        is an error or a refusal.
+        """
+        if not answer or not self.cacheable(question) or looks_like_refusal(answer):
+            return
+        kind, ttl = question_type(question)
+        scope = self.scope(graph_key)
+        vector = self._vector(question).tobytes()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO answers (scope, question, vector, answer, question_type, stored_at, ttl) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (scope, _canonical(question), vector, answer, kind, time.time(), ttl)
+            )
+            self._conn.execute("DELETE FROM answers WHERE stored_at + ttl < ?", (time.time(),))
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM answers")
+            self._conn.commit()
+
+
+_answer_cache = None
+_answer_cache_lock = threading.Lock()
+
+
+def get_answer_cache() -> AnswerCache:
+    """
+    Return the process-wide answer cache.
+    ANSWER_CACHE_PATH and ANSWER_CACHE_SIMILARITY configure it.
+    """
+    global _answer_cache
+    if _answer_cache is None:
+        with _answer_cache_lock:
+            if _answer_cache is None:
+                _answer_cache = AnswerCache(
+                    path=os.getenv("ANSWER_CACHE_PATH", DEFAULT_CACHE_PATH),
+                    similarity=float(os.getenv("ANSWER_CACHE_SIMILARITY", 0.92)),
+                )
+    return _answer_cache
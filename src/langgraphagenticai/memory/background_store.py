@@ -0,0 +1,111 @@
+import asyncio
+import atexit
+import contextvars
+import os
+import threading
+from typing import Awaitable, Callable
+
+from src.langgraphagenticai.utils.event_loop import get_loop_runner
+
+StoreJob = Callable[[], Awaitable[object]]
+
+
+class BackgroundStoreQueue:
+    """
+    Bounded queue of memory-storage jobs processed by one worker on the shared
+    background event loop, so storing memories never delays the answer.
+    - a full queue makes submit() wait up to put_timeout (backpressure) and then
+      drops the job rather than blocking the turn indefinitely
+    - jobs run one at a time, so duplicate detection sees earlier writes
+    - pending jobs are drained at interpreter exit
+    """
+    def __init__(self, maxsize: int = 32, put_timeout: float = 5.0, drain_timeout: float = 30.0):
+        self.maxsize = maxsize
+        self.put_timeout = put_timeout
+        self.drain_timeout = drain_timeout
+        self.enqueued = 0
+        self.processed = 0
+        self.failed = 0
+        self.dropped = 0
+        self._runner = get_loop_runner()
+        self._queue = None
+        self._worker = None
+        # atexit runs handlers in reverse order, so this drains before the loop runner stops
+        atexit.register(self.drain)
+
+    def _ensure_worker(self):
+        # Only called on the runner's loop, which owns the queue and the worker task
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.maxsize)
+        if self._worker is None or self._worker.done():
+            # Fresh context: jobs must not inherit the callbacks/tracing of the graph run that queued them
+            self._worker = asyncio.create_task(self._work(), context=contextvars.Context())
+
+    async def _work(self):
+        while True:
+            job = await self._queue.get()
+            try:
+                await job()
+                self.processed += 1
+            except Exception as e:
+                self.failed += 1
+                print(f"Background memory store failed: {e!r}")
+            finally:
+                self._queue.task_done()
+
+    async def _put(self, job: StoreJob) -> bool:
+        self._ensure_worker()
+        try:
+            await asyncio.wait_for(self._queue.put(job), self.put_timeout)
+        except asyncio.TimeoutError:
+            self.dropped += 1
+            print(f"Memory store queue full ({self.maxsize} pending), dropping job")
+            return False
+        self.enqueued += 1
+        return True
+
+    async def submit(self, job: StoreJob) -> bool:
+        """
+        Queue a storage job.
+        Args:
+            job: Zero-argument coroutine function doing the actual storage
+        Returns:
+            bool: False if the job was dropped because the queue stayed full
+        """
+        if asyncio.get_running_loop() is self._runner.loop:
+            return await self._put(job)
+        return await asyncio.wrap_future(self._runner.submit(self._put(job)))
+
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def drain(self, timeout: float = None) -> bool:
+        """
+        Block until all queued jobs have been processed.
+        Returns False if the timeout expired first.
+        """
+        if self._queue is None or not self._runner.loop.is_running():
+            return True
+        try:
+            self._runner.run(self._queue.join(), timeout or self.drain_timeout)
+            return True
+        except Exception as e:
+            print(f"Memory store queue not drained ({self.pending()} pending): {e!r}")
+            return False
+
+
+_store_queue = None
+_store_queue_lock = threading.Lock()
+
+
+def get_background_store() -> BackgroundStoreQueue:
+    """
+    Return the process-wide background memory store queue.
+    MEMORY_STORE_QUEUE_SIZE bounds the number of pending jobs.
+    """
+    global _store_queue
+    if _store_queue is None:
+        with _store_queue_lock:
+            if _store_queue is None:
+                _store_queue = BackgroundStoreQueue(maxsize=int(os.getenv("MEMORY_STORE_QUEUE_SIZE", 32)))
+    return _store_queue
@@ -0,0 +1,198 @@
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from src.langgraphagenticai.utils.event_loop import get_loop_runner
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except Exception:  # tiktoken missing or its encoding file not downloadable
+    _encoding = None
+
+Summarizer = Callable[[str, List[Dict]], Awaitable[str]]
+
+# Share of the budget the latest turn keeps when it has to be clipped
+MIN_LATEST_TURN_SHARE = 0.25
+
+
+def count_tokens(text: str) -> int:
+    """
+    Token count of a text. Uses cl100k_base when tiktoken is available, which is
+    close enough for budgeting across providers, and ~4 characters per token otherwise.
+    """
+    if not text:
+        return 0
+    if _encoding is not None:
+        return len(_encoding.encode(text, disallowed_special=()))
+    return max(1, len(text) // 4)
+
+
+def clip_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut a text to at most max_tokens tokens."""
+    if max_tokens <= 0:
+        return ""
+    if _encoding is not None:
+        tokens = _encoding.encode(text, disallowed_special=())
+        return text if len(tokens) <= max_tokens else _encoding.decode(tokens[:max_tokens]) + " …"
+    return text if len(text) <= max_tokens * 4 else text[:max_tokens * 4] + " …"
+
+
+def llm_summarizer(llm) -> Summarizer:
+    """
+    Summarizer that folds evicted turns into the running summary with one LLM call.
+    """
+    async def summarize(previous_summary: str, evicted: List[Dict]) -> str:
+        transcript = "\n".join(f"{turn['role']}: {turn['content']}" for turn in evicted)
+        response = await llm.ainvoke([
+            SystemMessage(content="You maintain a running summary of a conversation between a user and an assistant. "
+                                  "Merge the new turns into the existing summary. Keep names, preferences, restaurants, "
+                                  "decisions and open questions; drop raw tool output and pleasantries. "
+                                  "Answer with the updated summary only, at most a short paragraph."),
+            HumanMessage(content=f"Existing summary:\n{previous_summary or '(none)'}\n\nNew turns:\n{transcript}"),
+        ])
+        return response.content if hasattr(response, "content") else str(response)
+    return summarize
+
+
+def extractive_summarizer(previous_summary: str, evicted: List[Dict]) -> str:
+    """Fallback without an LLM: keep the start of every evicted turn."""
+    lines = [previous_summary] if previous_summary else []
+    lines += [f"{turn['role']}: {clip_to_tokens(turn['content'], 40)}" for turn in evicted]
+    return "\n".join(lines)
+
+
+class ChatHistoryManager:
+    """
+    Conversation history kept within a token budget.
+    Token counts are computed once per message when it is added. When the history
+    (plus the summary) exceeds the budget, the oldest user/assistant turns are
+    evicted down to low_watermark * budget and folded into a rolling summary, so
+    the prompt stays roughly the same size however long the conversation gets and
+    summarization runs only every few turns.
+    Evicted turns are folded into an extractive summary right away; the LLM
+    summary runs on the background event loop and replaces it on a later turn,
+    so summarizing never delays the answer.
+    """
+    def __init__(self, token_budget: int = 6000, max_messages: Optional[int] = None,
+                 summarizer: Optional[Summarizer] = None, summary_budget: int = 400, low_watermark: float = 0.75):
+        self.token_budget = token_budget
+        self.max_messages = max_messages
+        self.summarizer = summarizer
+        self.summary_budget = summary_budget
+        self.low_watermark = low_watermark
+        self.turns: List[Dict] = []  # {"role", "content", "tokens"}
+        self.total_tokens = 0
+        self.summary = ""
+        self.summary_tokens = 0
+        self._pending: Optional[Future] = None  # LLM summary of the current summary, still running
+
+    def _set_summary(self, summary: str):
+        self.summary = clip_to_tokens(summary.strip(), self.summary_budget)
+        self.summary_tokens = count_tokens(self.summary)
+
+    def _apply_pending(self):
+        """Swap in the background LLM summary once it is ready."""
+        if self._pending is None or not self._pending.done():
+            return
+        future, self._pending = self._pending, None
+        try:
+            summary = future.result()
+        except Exception as e:
+            print(f"History summarization failed, keeping an extractive summary: {e}")
+            return
+        if summary:
+            self._set_summary(summary)
+
+    def _append(self, role: str, content: str):
+        tokens = count_tokens(content)
+        self.turns.append({"role": role, "content": content, "tokens": tokens})
+        self.total_tokens += tokens
+
+    def _pop_oldest(self) -> Dict:
+        turn = self.turns.pop(0)
+        self.total_tokens -= turn["tokens"]
+        return turn
+
+    def _over(self, limit: int) -> bool:
+        too_many = self.max_messages is not None and len(self.turns) > self.max_messages
+        return too_many or self.total_tokens + self.summary_tokens > limit
+
+    def load(self, messages: List[Dict]):
+        """
+        Seed the history from existing {"role", "content"} messages (e.g. a session
+        that predates the manager).
+        """
+        for message in messages:
+            self._append(message["role"], str(message["content"]))
+        if self._over(self.token_budget):
+            self._evict(int(self.token_budget * self.low_watermark))
+
+    def add_turn(self, user_message: str, assistant_reply: str):
+        """
+        Record a finished turn and enforce the budget.
+        """
+        self._apply_pending()
+        self._append("user", user_message)
+        self._append("assistant", assistant_reply)
+        if self._over(self.token_budget):
+            self._evict(int(self.token_budget * self.low_watermark))
+
+    def _evict(self, target: int):
+        evicted = []
+        # Always keep the latest turn verbatim so follow-up questions have their context
+        while len(self.turns) > 2 and self._over(target):
+            evicted.append(self._pop_oldest())
+            # Evict whole turns, the history never starts with an orphan answer
+            if self.turns and self.turns[0]["role"] == "assistant" and len(self.turns) > 2:
+                evicted.append(self._pop_oldest())
+        if evicted:
+            self._fold(evicted)
+
+        # A single oversized turn (long tool output) is clipped instead: the summary
+        # shrinks first, and the latest turn always keeps a slice of the budget
+        if self.turns and self.total_tokens + self.summary_tokens > self.token_budget:
+            last = self.turns[-1]
+            others = self.total_tokens - last["tokens"]
+            keep = min(last["tokens"], max(1, int(self.token_budget * MIN_LATEST_TURN_SHARE)))
+            summary_room = self.token_budget - others - keep
+            if self.summary_tokens > summary_room:
+                self._set_summary(clip_to_tokens(self.summary, summary_room))
+            room = max(keep, self.token_budget - self.summary_tokens - others)
+            if last["tokens"] <= room:
+                return
+            clipped = clip_to_tokens(last["content"], room)
+            self.total_tokens -= last["tokens"]
+            last["content"], last["tokens"] = clipped, count_tokens(clipped)
+            self.total_tokens += last["tokens"]
+
+    def _fold(self, evicted: List[Dict]):
+        previous_summary = self.summary
+        self._set_summary(extractive_summarizer(previous_summary, evicted))
+        if self.summarizer:
+            # A newer summary supersedes a still-running one, whose result would miss these turns
+            if self._pending is not None:
+                self._pending.cancel()
+            self._pending = get_loop_runner().submit(self.summarizer(previous_summary, evicted))
+
+    def messages(self, system_prompt: str, user_message: str) -> List[Dict]:
+        """
+        Prompt messages for the next turn: system prompt, summary, kept history, new question.
+        """
+        self._apply_pending()
+        messages = [{"role": "system", "content": system_prompt}]
+        if self.summary:
+            messages.append({"role": "system", "content": f"Summary of the earlier conversation:\n{self.summary}"})
+        messages += [{"role": turn["role"], "content": turn["content"]} for turn in self.turns]
+        messages.append({"role": "user", "content": user_message})
+        return messages
+
+    def clear(self):
+        self.turns = []
+        self.total_tokens = 0
+        self.summary = ""
+        self.summary_tokens = 0
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
@@ -0,0 +1,177 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from src.langgraphagenticai.utils.metrics import registry
+
+DEFAULT_CACHE_PATH = "./.embedding_cache/embeddings.sqlite"
+DEFAULT_CACHE_SIZE = 50000
+
+
+def normalize_text(text: str) -> str:
+    """
+    Canonical form used for cache keys, so texts that only differ in case,
+    Unicode form or whitespace share one embedding.
+    """
+    text = unicodedata.normalize("NFKC", text)
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+class HashingEmbeddings(Embeddings):
+    """
+    Offline embedding backend based on feature hashing.
+    Words and character trigrams are hashed into a fixed number of signed buckets
+    and the vector is L2-normalized. No model download and no network, so the
+    memory path can run and be benchmarked anywhere.
+    """
+    def __init__(self, dimensions: int = 384):
+        self.dimensions = dimensions
+
+    @property
+    def model_name(self) -> str:
+        return f"hashing-{self.dimensions}"
+
+    def _features(self, text: str) -> List[str]:
+        text = normalize_text(text)
+        words = re.findall(r"\w+", text)
+        features = [f"w:{word}" for word in words]
+        for word in words:
+            padded = f"#{word}#"
+            features.extend(f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+        return features
+
+    def _embed(self, text: str) -> List[float]:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for feature in self._features(text):
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            vector[value % self.dimensions] += 1.0 if (value >> 63) & 1 else -1.0
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector.tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(text)
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Content-addressed, disk-backed cache in front of any LangChain embedder.
+    Entries are keyed by (model, kind, hash of the normalized text) in SQLite and
+    the least recently used entries are evicted beyond max_entries.
+    """
+    def __init__(self, underlying: Embeddings, model_name: str,
+                 cache_path: str = DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_CACHE_SIZE):
+        self.underlying = underlying
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        registry.register_cache(f"embeddings:{model_name}", self)
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        self._conn.commit()
+
+    def _key(self, kind: str, text: str) -> str:
+        digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+        return f"{self.model_name}:{kind}:{digest}"
+
+    def _lookup(self, keys: List[str]) -> dict:
+        found = {}
+        now = time.time()
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+            if found:
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE key = ?", [(now, key) for key in found]
+                )
+                self._conn.commit()
+        return found
+
+    def _store(self, items: List[tuple]):
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                [(key, np.asarray(vector, dtype=np.float32).tobytes(), now) for key, vector in items]
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM embeddings WHERE key IN (SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries,)
+                )
+            self._conn.commit()
+
+    def _embed_cached(self, kind: str, texts: List[str], embed_missing) -> List[List[float]]:
+        keys = [self._key(kind, text) for text in texts]
+        found = self._lookup(list(dict.fromkeys(keys)))
+
+        # Embed each distinct missing text once, in a single batch call
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+        self.hits += len(keys) - sum(1 for key in keys if key in missing)
+        self.misses += len(missing)
+        if missing:
+            vectors = embed_missing(list(missing.values()))
+            computed = list(zip(missing.keys(), vectors))
+            self._store(computed)
+            found.update(computed)
+        return [list(found[key]) for key in keys]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embed_cached("document", texts, self.underlying.embed_documents)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed_cached("query", [text], lambda missing: [self.underlying.embed_query(missing[0])])[0]
+
+
+def build_embeddings(backend: Optional[str] = None) -> Embeddings:
+    """
+    Build the configured embedder wrapped in the disk cache.
+    EMBEDDING_BACKEND selects "openai" (default) or "hashing" for fully offline runs;
+    EMBEDDING_CACHE_PATH and EMBEDDING_CACHE_SIZE configure the cache.
+    """
+    backend = (backend or os.getenv("EMBEDDING_BACKEND", "openai")).lower()
+    if backend == "hashing":
+        underlying = HashingEmbeddings()
+        model_name = underlying.model_name
+    elif backend == "openai":
+        from langchain_openai import OpenAIEmbeddings
+        underlying = OpenAIEmbeddings()
+        model_name = f"openai-{underlying.model}"
+    else:
+        raise ValueError(f"Unknown EMBEDDING_BACKEND: {backend}")
+
+    return CachedEmbeddings(
+        underlying,
+        model_name,
+        cache_path=os.getenv("EMBEDDING_CACHE_PATH", DEFAULT_CACHE_PATH),
+        max_entries=int(os.getenv("EMBEDDING_CACHE_SIZE", DEFAULT_CACHE_SIZE))
+    )
@@ -0,0 +1,79 @@
+import asyncio
+import os
+import threading
+from typing import List
+
+from langchain_chroma import Chroma
+
+from src.langgraphagenticai.memory.embeddings import build_embeddings
+from src.langgraphagenticai.utils.metrics import VECTOR_MEMORY_LATENCY
+
+DEFAULT_PERSIST_DIRECTORY = "./chroma_openai"
+
+
+class VectorMemoryService:
+    """
+    Long-lived owner of the personal-memory Chroma collection and its embedder.
+    Both are created once per process instead of on every retrieve/store call.
+    """
+    def __init__(self, persist_directory: str = DEFAULT_PERSIST_DIRECTORY, embedding=None, backend: str = None):
+        self.persist_directory = persist_directory
+        self.backend = backend
+        self._embedding = embedding
+        self._db = None
+        self._lock = threading.Lock()
+
+    @property
+    def embedding(self):
+        if self._embedding is None:
+            self._embedding = build_embeddings(self.backend)
+        return self._embedding
+
+    @property
+    def db(self) -> Chroma:
+        if self._db is None:
+            with self._lock:
+                if self._db is None:
+                    self._db = Chroma(persist_directory=self.persist_directory, embedding_function=self.embedding)
+        return self._db
+
+    def search_sync(self, query: str, k: int = 4) -> str:
+        """
+        Return the stored documents most similar to the query, formatted for a prompt.
+        """
+        with VECTOR_MEMORY_LATENCY.time(operation="search"):
+            docs = self.db.similarity_search(query, k=k)
+        return "\n".join([f"Document: {doc.page_content}" for doc in docs])
+
+    def add_sync(self, texts: List[str]) -> List[str]:
+        """
+        Embed and store the given texts in the collection.
+        """
+        with VECTOR_MEMORY_LATENCY.time(operation="add"):
+            return self.db.add_texts(texts=texts)
+
+    async def search(self, query: str, k: int = 4) -> str:
+        # Chroma and the embedder are blocking clients, keep them off the event loop
+        return await asyncio.to_thread(self.search_sync, query, k)
+
+    async def add(self, texts: List[str]) -> List[str]:
+        return await asyncio.to_thread(self.add_sync, texts)
+
+
+_memory = None
+_memory_lock = threading.Lock()
+
+
+def get_vector_memory() -> VectorMemoryService:
+    """
+    Return the process-wide vector memory service.
+    Each embedding backend gets its own Chroma directory since vector sizes differ.
+    """
+    global _memory
+    if _memory is None:
+        with _memory_lock:
+            if _memory is None:
+                backend = os.getenv("EMBEDDING_BACKEND", "openai").lower()
+                persist_directory = DEFAULT_PERSIST_DIRECTORY if backend == "openai" else f"./chroma_{backend}"
+                _memory = VectorMemoryService(persist_directory, backend=backend)
+    return _memory
@@ -0,0 +1,181 @@
+import math
+import os
+import re
+import threading
+from typing import Dict, NamedTuple, Optional
+
+# Phrases that mark an answer as a non-answer ("I don't know", no data, no live access, ...)
+REFUSAL_PATTERNS = [
+    r"\bi (?:do not|don't|dont) know\b",
+    r"\bi(?:'m| am) not (?:sure|certain|aware)\b",
+    r"\bi (?:could not|couldn't|cannot|can't|was unable to|am unable to) (?:find|locate|access|retrieve|determine|provide|answer|help)\b",
+    r"\bi (?:do not|don't) have (?:any )?(?:information|access|details|data|real[- ]time)\b",
+    r"\b(?:no|not enough) (?:information|data|details|results) (?:is |are )?(?:available|found)\b",
+    r"\bunable to (?:find|retrieve|access|determine)\b",
+    r"\bas an ai\b",
+    r"\bmy (?:knowledge|training data) (?:cutoff|only goes)\b",
+    r"\bich wei(?:ß|ss) (?:es )?nicht\b",
+    r"\bkeine informationen\b",
+    r"^error:",
+]
+_REFUSAL_RE = re.compile("|".join(f"(?:{pattern})" for pattern in REFUSAL_PATTERNS), re.IGNORECASE | re.MULTILINE)
+
+HEDGE_TERMS = {"maybe", "perhaps", "might", "possibly", "probably", "unclear", "unsure", "unfortunately", "sorry"}
+
+STOPWORDS = {
+    "the", "a", "an", "is", "are", "was", "were", "be", "to", "of", "in", "on", "at", "for", "and", "or",
+    "what", "which", "who", "where", "when", "how", "why", "do", "does", "did", "can", "could", "would",
+    "should", "i", "me", "my", "you", "your", "it", "this", "that", "there", "any", "some", "about",
+    "with", "from", "tell", "please", "give", "know", "today", "now",
+}
+
+# Weights of the lightweight scorer, a hand-tuned logistic model over cheap answer features
+SCORER_WEIGHTS = {
+    "bias": 0.4,
+    "refusal": -3.0,
+    "hedges": -0.6,
+    "overlap": 2.0,
+    "length": 1.2,
+    "specifics": 0.8,
+}
+
+
+class Verdict(NamedTuple):
+    """
+    Outcome of the local evaluation. result is None when the case is uncertain
+    and has to be escalated to the LLM evaluator.
+    """
+    result: Optional[bool]
+    score: float
+    reason: str
+
+
+def looks_like_refusal(text: str) -> bool:
+    """True if the text contains one of the refusal/error phrases."""
+    return bool(_REFUSAL_RE.search(text or ""))
+
+
+def _content_words(text: str) -> set:
+    return {word for word in re.findall(r"\w+", text.lower()) if len(word) > 2 and word not in STOPWORDS}
+
+
+class AnswerEvaluator:
+    """
+    Cheap local pre-filter for evaluate_node.
+    Clear non-answers (a short answer that is mostly a refusal, empty or error
+    answers) are rejected and clearly substantive answers accepted without an LLM
+    call; everything in between, including partial answers that refuse one part
+    but give concrete facts, is escalated. Decision counts are kept for monitoring.
+    """
+    def __init__(self, accept_threshold: float = 0.8, reject_threshold: float = 0.2, use_scorer: bool = True):
+        self.accept_threshold = accept_threshold
+        self.reject_threshold = reject_threshold
+        self.use_scorer = use_scorer
+        self._lock = threading.Lock()
+        self.stats = {
+            "local_accept": 0,
+            "local_reject": 0,
+            "escalated": 0,
+            "llm_accept": 0,
+            "llm_reject": 0,
+        }
+
+    def features(self, question: str, answer: str) -> Dict[str, float]:
+        words = answer.split()
+        question_words = _content_words(question)
+        answer_words = _content_words(answer)
+        overlap = len(question_words & answer_words) / len(question_words) if question_words else 0.5
+        return {
+            "refusal": float(len(_REFUSAL_RE.findall(answer))),
+            "hedges": float(sum(1 for word in words if word.lower().strip(".,!?") in HEDGE_TERMS)),
+            "overlap": overlap,
+            "length": min(len(words) / 40.0, 1.0),
+            # Numbers, prices, times, addresses, links and list items indicate concrete content
+            "specifics": min(len(re.findall(r"\d+|€|https?://|^\s*[-*•]", answer, re.MULTILINE)) / 3.0, 1.0),
+        }
+
+    def score(self, question: str, answer: str) -> float:
+        """
+        Probability-like score that the answer is relevant and not a refusal.
+        """
+        features = self.features(question, answer)
+        z = SCORER_WEIGHTS["bias"] + sum(SCORER_WEIGHTS[name] * value for name, value in features.items())
+        return 1.0 / (1.0 + math.exp(-z))
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def evaluate(self, question: str, answer: str) -> Verdict:
+        """
+        Decide locally if possible.
+        Args:
+            question (str): The user's question
+            answer (str): The assistant's answer
+        Returns:
+            Verdict: result True/False for clear cases, None to escalate to the LLM
+        """
+        answer = (answer or "").strip()
+        if not answer:
+            self._count("local_reject")
+            return Verdict(False, 0.0, "empty answer")
+
+        refusals = _REFUSAL_RE.findall(answer)
+        # "I couldn't find the opening hours, but X is at Leopoldstr. 12" is a partial answer, not a refusal
+        partial = (bool(refusals) and not answer.lower().startswith("error:")
+                   and self.features(question, answer)["specifics"] > 0)
+        if refusals and not partial and len(answer.split()) <= 40:
+            self._count("local_reject")
+            return Verdict(False, 0.0, "short answer with refusal phrase")
+
+        if self.use_scorer:
+            score = self.score(question, answer)
+            if score >= self.accept_threshold and not refusals:
+                self._count("local_accept")
+                return Verdict(True, score, "scorer accepted")
+            # Partial answers are left to the LLM evaluator, the refusal weight alone would reject them
+            if score <= self.reject_threshold and not partial:
+                self._count("local_reject")
+                return Verdict(False, score, "scorer rejected")
+        else:
+            score = 0.5
+
+        self._count("escalated")
+        return Verdict(None, score, "uncertain, escalating to LLM")
+
+    def record_llm_result(self, result: bool):
+        self._count("llm_accept" if result else "llm_reject")
+
+    @property
+    def escalation_rate(self) -> float:
+        with self._lock:
+            total = self.stats["local_accept"] + self.stats["local_reject"] + self.stats["escalated"]
+            return self.stats["escalated"] / total if total else 0.0
+
+    def summary(self) -> Dict:
+        with self._lock:
+            stats = dict(self.stats)
+        stats["escalation_rate"] = round(self.escalation_rate, 3)
+        return stats
+
+
+_evaluator = None
+_evaluator_lock = threading.Lock()
+
+
+def get_answer_evaluator() -> AnswerEvaluator:
+    """
+    Return the process-wide answer evaluator, so the stats cover all graphs.
+    ANSWER_EVAL_ACCEPT / ANSWER_EVAL_REJECT set the scorer thresholds and
+    ANSWER_EVAL_SCORER=false limits the local check to the refusal patterns.
+    """
+    global _evaluator
+    if _evaluator is None:
+        with _evaluator_lock:
+            if _evaluator is None:
+                _evaluator = AnswerEvaluator(
+                    accept_threshold=float(os.getenv("ANSWER_EVAL_ACCEPT", 0.8)),
+                    reject_threshold=float(os.getenv("ANSWER_EVAL_REJECT", 0.2)),
+                    use_scorer=os.getenv("ANSWER_EVAL_SCORER", "true").lower() != "false",
+                )
+    return _evaluator
@@ -1,19 +1,14 @@
-from langchain_mcp_adapters.client import MultiServerMCPClient
 from langgraph.prebuilt import create_react_agent
 from langchain_groq import ChatGroq
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_chroma import Chroma
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 import os
 import sys
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
-import asyncio #asyncio is a library for asynchronous programming in Python.
 from pathlib import Path
 #from langchain_community.embeddings import OllamaEmbeddings
-from langchain_openai import OpenAIEmbeddings
-from tavily import TavilyClient
 from langchain_core.prompts import ChatPromptTemplate
 from datetime import datetime
 
@@ -21,6 +16,13 @@ current_file = Path(__file__).resolve()
 project_root = current_file.parent.parent.parent.parent
 sys.path.append(str(project_root))
 from src.langgraphagenticai.state.state import State
+from src.langgraphagenticai.tools.mcp_client import get_mcp_client_manager
+from src.langgraphagenticai.memory.vector_memory import get_vector_memory
+from src.langgraphagenticai.memory.background_store import get_background_store
+from src.langgraphagenticai.nodes.answer_evaluator import get_answer_evaluator
+from src.langgraphagenticai.tools.web_search import aweb_search_many, QUERY_VARIANTS
+from src.langgraphagenticai.utils.event_loop import run_async
+from src.langgraphagenticai.utils.streaming import ANSWER_CONFIG
 load_dotenv()
 os.environ["GROQ_API_KEY"]=os.getenv("GROQ_API_KEY")
 os.environ["GEMINI_API_KEY"]=os.getenv("GEMINI_API_KEY")
@@ -43,7 +45,7 @@ class BasicChatbotNode:
         """
         Processes the input state and generates a chatbot response.
         """
-        response = self.llm.invoke(state['messages'])
+        response = self.llm.invoke(state['messages'], config=ANSWER_CONFIG) #Tagged so the UI streams its tokens
     
     #Error handling for the response 
         # If response is an AIMessage, extract .content
@@ -59,30 +61,35 @@ class RestaurantRecommendationNode:
     """
     Restaurant Recommendation Node  
     """
-    def __init__(self,model):
+    def __init__(self,model,background_store=False):
         self.llm=model
+        self.memory=get_vector_memory() #One Chroma handle and embedder shared by all turns
+        self.background_store=background_store #Queue store_node work instead of awaiting it
+        self.evaluator=get_answer_evaluator() #Local pre-filter in front of the LLM evaluator
 
-    def retrieve_node(self,state:State)->dict:
+    @staticmethod
+    def _last_user_input(messages) -> str:
+        """
+        Returns the content of the most recent user message.
+        """
+        for message in reversed(messages):
+            if isinstance(message, HumanMessage):
+                return message.content
+            if isinstance(message, dict) and message.get("role") == "user":
+                return message.get("content", "")
+        last_message = messages[-1]
+        return last_message.content if hasattr(last_message, 'content') else str(last_message)
+
+    async def retrieve_node(self,state:State)->dict:
         """
         Processes the input state and retrieves information from the long term memory.
         """
-        #print(state)
         messages = state["messages"]
         if not messages:
-            return {"messages": "No messages to process"}
-        
-        # Get the last message content
-        last_message = messages[-2]
-        if hasattr(last_message, 'content'):
-            user_input = last_message.content
-        elif isinstance(last_message, dict) and 'content' in last_message:
-            user_input = last_message['content']
-        else:
-            user_input = str(last_message)
-        embedding=OpenAIEmbeddings()
-        db = Chroma(persist_directory="./chroma_openai", embedding_function=embedding)
-        docs=db.similarity_search(user_input)
-        retrieved_info = "\n".join([f"Document: {doc.page_content}" for doc in docs])
+            return {"retrieved_info": ""}
+
+        user_input = self._last_user_input(messages)
+        retrieved_info = await self.memory.search(user_input)
         return {"retrieved_info": retrieved_info}
 
     async def process(self,state:State)->dict:
@@ -91,27 +98,16 @@ class RestaurantRecommendationNode:
         """
         print("Chatbot_node called")
         try:
-            #MultiServerMCPClient is a client that can connect to multiple MCP servers.
-            client=MultiServerMCPClient( 
-                {
-                    "restaurant":{
-                        "url": "http://127.0.0.1:8002/mcp", 
-                        "transport": "streamable_http",
-                    },
-                    "Parking":{
-                        "url": "http://127.0.0.1:8003/mcp", 
-                        "transport": "streamable_http",
-                    }
-                }
-            )
-            
-            tools=await client.get_tools()
+            #Shared MCP client: sessions and the tool list are reused across messages
+            tools=await get_mcp_client_manager().get_tools()
             model=self.llm
             agent=create_react_agent(
                 model, tools
             )
-            #print(state['messages'])
-            retrieved_info=self.retrieve_node(state)
+            #Retrieve once per turn; the result is kept in the state for store_node
+            retrieved_info=state.get("retrieved_info")
+            if retrieved_info is None:
+                retrieved_info=(await self.retrieve_node(state))["retrieved_info"]
             rag_system_message = SystemMessage(
                 content=f"Relevant information retrieved for this query based on personal information:\n\n{retrieved_info}"
             )
@@ -119,46 +115,49 @@ class RestaurantRecommendationNode:
             conversation = state["messages"][1:]
             messages = [base_system_msg, rag_system_message] + conversation
             response = await agent.ainvoke(
-                {"messages": messages}
+                {"messages": messages}, config=ANSWER_CONFIG
             )
         except Exception as e:
             print(e)
             return {"messages": "Error: " + str(e)}
-        return {"messages": AIMessage(content=response['messages'][-1].content)}
+        return {"messages": AIMessage(content=response['messages'][-1].content), "retrieved_info": retrieved_info}
     
-    #When called async directly from graph builter it gave error so added a sync function which calls the asyncio function
+    #The graph registers process directly as an async node; this wrapper is for sync callers outside the graph
     def process_sync(self, state: State) -> dict:
         """
         Processes the input state and generates a chatbot response.
         """
-        return asyncio.run(self.process(state))
+        return run_async(self.process(state))
     
 
-    def store_node(self,state:State)->dict:
+    async def store_node(self,state:State)->dict:
         """
         Processes the input state and decides whether to store information in a single LLM call.
+        In background mode the work is queued and the turn finishes without waiting for it.
         """
         print("store_node called")
         # Extract the last user message content from the messages list
         messages = state["messages"]
-        #print(messages)
         if not messages:
             return {"messages": "No messages to process"}
-        
-        # Get the last message content
-        last_message = messages[-2]
-        if hasattr(last_message, 'content'):
-            user_input = last_message.content
-        elif isinstance(last_message, dict) and 'content' in last_message:
-            user_input = last_message['content']
-        else:
-            user_input = str(last_message)
-        embedding=OpenAIEmbeddings()
-        
-        retrieved_info=self.retrieve_node(state)
+
+        user_input = self._last_user_input(messages)
+        # Reuse what the chatbot step already retrieved for this turn
+        retrieved_info=state.get("retrieved_info")
+        if self.background_store:
+            await get_background_store().submit(lambda: self.store_memory(user_input, retrieved_info))
+            return {}
+        return await self.store_memory(user_input, retrieved_info)
+
+    async def store_memory(self, user_input: str, retrieved_info: str = None) -> dict:
+        """
+        Decides whether the user input should be stored in long term memory and stores it.
+        """
+        if retrieved_info is None:
+            retrieved_info=await self.memory.search(user_input)
         # Single LLM call to make all decisions
         llm_with_structured = self.llm.with_structured_output(StorageDecision)
-        response = llm_with_structured.invoke([
+        response = await llm_with_structured.ainvoke([
             SystemMessage(content="""
                 You are a helpful assistant that decides whether to store user information.
                 
@@ -186,7 +185,7 @@ class RestaurantRecommendationNode:
         if response.should_store and response.message_to_store:
             text_splitter = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=0)
             splits = text_splitter.split_text(response.message_to_store)
-            vectordb=Chroma.from_texts(texts=splits,embedding=embedding,persist_directory="./chroma_openai")
+            await self.memory.add(splits)
         
         result={
             "stored": response.should_store,
@@ -225,6 +224,12 @@ class RestaurantRecommendationNode:
         if not last_human or not last_ai:
             return {"result": False}
 
+        # Clear cases are decided locally; only uncertain answers cost an LLM call
+        verdict = self.evaluator.evaluate(last_human.content, last_ai.content)
+        if verdict.result is not None:
+            print(f"evaluate_node: {verdict.reason} (score {verdict.score:.2f})")
+            return {"result": verdict.result}
+
         # Use the LLM to check if the answer is relevant and not an "I don't know" response
         prompt = (
             "You are an evaluator. Given the user's question and the assistant's answer, "
@@ -238,18 +243,20 @@ class RestaurantRecommendationNode:
 
         llm_with_structured = self.llm.with_structured_output(EvaluationResult)
         result = llm_with_structured.invoke(prompt)
+        self.evaluator.record_llm_result(result.result)
+        print(f"evaluate_node: escalated to LLM -> {result.result} {self.evaluator.summary()}")
 
         # result is an EvaluationResult instance
         return {"result": result.result}
 
-    def search_node(self, state: State) -> dict:
+    async def search_node(self, state: State) -> dict:
         """
-        Processes the input state and searches for information in the long term memory.
+        Processes the input state and searches the web for an answer.
         Removes the last AIMessage from the messages, uses the last HumanMessage as the query,
         and returns the result in the same format as the process node.
+        Searches are cached and WEB_SEARCH_VARIANTS > 1 runs several query variants concurrently.
         """
         print("search_node called")
-        tavily = TavilyClient()
         model = self.llm
 
         # Copy messages to avoid mutating the original state
@@ -290,18 +297,25 @@ class RestaurantRecommendationNode:
             f"Chat history:\n{chat_history_str}\n\n"
             f"Current user question: {last_human.content}\n\n"
             f"Current date and time: {now}\n\n"
-            "Search query:"
         )
-        search_query_result = self.llm.invoke(query_generation_prompt)
+        if QUERY_VARIANTS > 1:
+            query_generation_prompt += (
+                f"Write up to {QUERY_VARIANTS} differently worded search queries, one per line, "
+                "without numbering or quotes.\n\nSearch queries:"
+            )
+        else:
+            query_generation_prompt += "Search query:"
+        search_query_result = await self.llm.ainvoke(query_generation_prompt)
         if hasattr(search_query_result, "content"):
             search_query = search_query_result.content.strip()
         elif isinstance(search_query_result, dict) and "content" in search_query_result:
             search_query = search_query_result["content"].strip()
         else:
             search_query = str(search_query_result).strip()
-        print("search_query-",search_query)
-        # Now use the generated query for Tavily
-        tavily_results = tavily.search(query=search_query).get('results', [])
+        search_queries = [line.strip(" -*\t") for line in search_query.splitlines() if line.strip(" -*\t")][:QUERY_VARIANTS] or [last_human.content]
+        print("search_query-",search_queries)
+        # Now use the generated queries for Tavily (cached, run concurrently, deduplicated by URL)
+        tavily_results = await aweb_search_many(search_queries)
 
         # Prepare articles string for the LLM
         articles_str = "\n\n".join([
@@ -326,10 +340,10 @@ class RestaurantRecommendationNode:
         ])
 
         # Get the LLM's answer
-        llm_response = self.llm.invoke(prompt_template.format(
+        llm_response = await self.llm.ainvoke(prompt_template.format(
             chat_history=chat_history_str,
             articles=articles_str
-        ))
+        ), config=ANSWER_CONFIG)
         #print(llm_response)
         # Return in the same format as process node
         if hasattr(llm_response, "content"):
@@ -345,40 +359,27 @@ class RestaurantRecommendationNode:
         """
         print("restaurant_node called")
         try:
-            #MultiServerMCPClient is a client that can connect to multiple MCP servers.
-            client=MultiServerMCPClient( 
-                {
-                    "restaurant":{
-                        "url": "http://127.0.0.1:8002/mcp", 
-                        "transport": "streamable_http",
-                    },
-                    "Parking":{
-                        "url": "http://127.0.0.1:8003/mcp", 
-                        "transport": "streamable_http",
-                    }
-                }
-            )
-            
-            tools=await client.get_tools()
+            #Shared MCP client: sessions and the tool list are reused across messages
+            tools=await get_mcp_client_manager().get_tools()
             model=self.llm
             agent=create_react_agent(
                 model, tools
             )
 
             response = await agent.ainvoke(
-                {"messages": state["messages"]}
+                {"messages": state["messages"]}, config=ANSWER_CONFIG
             )
         except Exception as e:
             print(e)
             return {"messages": "Error: " + str(e)}
         return {"messages": AIMessage(content=response['messages'][-1].content)}
     
-    #When called async directly from graph builter it gave error so added a sync function which calls the asyncio function
+    #The graph registers restaurant_node directly as an async node; this wrapper is for sync callers outside the graph
     def restaurant_node_sync(self, state: State) -> dict:
         """
         Processes the input state and generates a chatbot response.
         """
-        return asyncio.run(self.restaurant_node(state))
+        return run_async(self.restaurant_node(state))
 
 
 if __name__ == "__main__":
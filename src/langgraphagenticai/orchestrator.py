@@ -15,14 +15,38 @@ from typing import Annotated, TypedDict
 from langgraph.graph import StateGraph, START, END
 from datetime import datetime
 import asyncio
-from langchain_mcp_adapters.client import MultiServerMCPClient
+import sys
+import weakref
+from pathlib import Path
 from langgraph.prebuilt import create_react_agent
 
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent
+sys.path.append(str(project_root))
+from src.langgraphagenticai.tools.mcp_client import get_mcp_client_manager
+from src.langgraphagenticai.tools.restaurant_catalog import get_restaurant_catalog
+
 os.environ["OPENAI_API_KEY"]=os.getenv("OPENAI_API_KEY")
 os.environ["GROQ_API_KEY"]=os.getenv("GROQ_API_KEY")
 os.environ["TAVILY_API_KEY"]=os.getenv("TAVILY_API_KEY")
 os.environ["GEMINI_API_KEY"]=os.getenv("GEMINI_API_KEY")
 
+# Section workers running at once, and seconds each section may take before it is skipped
+REPORT_MAX_CONCURRENCY=int(os.getenv("REPORT_MAX_CONCURRENCY", 3))
+REPORT_SECTION_TIMEOUT=float(os.getenv("REPORT_SECTION_TIMEOUT", 120))
+# Seconds each prefetch tool call may take
+DOSSIER_TOOL_TIMEOUT=float(os.getenv("DOSSIER_TOOL_TIMEOUT", 30))
+
+# MCP tools called once per report; every section worker gets their output
+DOSSIER_TOOLS = {
+    "restaurant": "get_restaurant_data",
+    "menu": "get_restaurant_menu",
+    "contact": "get_restaurant_contact_info",
+    "reviews": "get_googlereviews",
+    "weather": "get_weather",
+    "parking": "get_parking_near_restaurant",
+}
+
 #llm=ChatOpenAI(model="gpt-4.1-mini")
 #llm=ChatGroq(model="llama-3.3-70b-versatile")
 llm=ChatGroq(model="qwen-qwq-32b")
@@ -49,36 +73,50 @@ class State(TypedDict):
     ]  # All workers write to this key in parallel
     final_report: str  # Final report
     markdown_file: str  # Path to exported markdown file
+    restaurant_name: str  # Restaurant the report is about, if it is in the catalog
+    dossier: str  # Prefetched tool results shared by all workers
+    report_name: str  # Optional file name (without .md); defaults to a timestamp
 
 # Worker state
 class WorkerState(TypedDict):
     section: Section
+    dossier: str
     completed_sections: Annotated[list, operator.add]
 
 
+# One ReAct agent shared by all section workers: (tool names, compiled agent)
+_section_agent = None
+# Semaphores are bound to an event loop, so each loop gets its own
+_section_slots = weakref.WeakKeyDictionary()
+
+async def get_section_agent():
+    """Return the shared section-writing agent, rebuilt only when the MCP tool set changes"""
+    global _section_agent
+    tools=await get_mcp_client_manager().get_tools()
+    tool_names=tuple(tool.name for tool in tools)
+    if _section_agent is None or _section_agent[0] != tool_names:
+        _section_agent=(tool_names, create_react_agent(llm, tools))
+    return _section_agent[1]
+
+def section_slots() -> asyncio.Semaphore:
+    """Limits how many sections are written concurrently on the running loop"""
+    loop=asyncio.get_running_loop()
+    slots=_section_slots.get(loop)
+    if slots is None:
+        slots=_section_slots[loop]=asyncio.Semaphore(REPORT_MAX_CONCURRENCY)
+    return slots
+
 # Nodes
 async def orchestrator(state: State):
     """Orchestrator that generates a plan for the report"""
-    client=MultiServerMCPClient( 
-        {
-            "restaurant":{
-                "url": "http://127.0.0.1:8002/mcp", 
-                "transport": "streamable_http",
-            },
-            "Parking":{
-                "url": "http://127.0.0.1:8003/mcp", 
-                "transport": "streamable_http",
-            }
-        }
-    )
-    tools=await client.get_tools()
+    tools=await get_mcp_client_manager().get_tools()
     
     # Bind tools to LLM and then add structured output
     llm_with_tools = llm.bind_tools(tools)
     planner = llm_with_tools.with_structured_output(Sections)
 
     # Generate queries
-    report_sections = planner.invoke(
+    report_sections = await planner.ainvoke(
         [
             SystemMessage(content="Generate a clear and organized list of five topics and descriptions of words 20 to 30 to include in a restaurant report. The report should cover the restaurant’s name and description, location, menu, parking options, contact details, Google reviews, nearby restaurants, and any other relevant information. Use available tools or knowledge if needed to suggest comprehensive and logical report sections."),
             HumanMessage(content=f"Here is the report topic: {state['topic']}"),
@@ -89,35 +127,59 @@ async def orchestrator(state: State):
 
     return {"sections": report_sections.sections}
 
+def find_restaurant(topic: str):
+    """Return the catalog restaurant named in the topic (longest match), or None"""
+    topic=topic.lower()
+    matches=[name for name in get_restaurant_catalog().names() if name.lower() in topic]
+    return max(matches, key=len) if matches else None
+
+async def prefetch_dossier(state: State):
+    """Fetch the restaurant data every section needs once, with concurrent tool calls"""
+    restaurant_name=find_restaurant(state["topic"])
+    if restaurant_name is None:
+        print("No catalog restaurant found in the topic, workers will use the tools themselves")
+        return {"restaurant_name": "", "dossier": ""}
+
+    tools={tool.name: tool for tool in await get_mcp_client_manager().get_tools()}
+    keys=[key for key, tool_name in DOSSIER_TOOLS.items() if tool_name in tools]
+
+    async def fetch(key):
+        tool=tools[DOSSIER_TOOLS[key]]
+        try:
+            return await asyncio.wait_for(tool.ainvoke({"restaurant_name": restaurant_name}), DOSSIER_TOOL_TIMEOUT)
+        except Exception as e:
+            return f"unavailable ({e!r})"
+
+    results=await asyncio.gather(*[fetch(key) for key in keys])
+    dossier="\n\n".join(f"### {key}\n{result}" for key, result in zip(keys, results))
+    print(f"Dossier for {restaurant_name}: {', '.join(keys)}")
+    return {"restaurant_name": restaurant_name, "dossier": dossier}
+
 async def llm_call(state: WorkerState):
     """Worker writes a section of the report"""
-    client=MultiServerMCPClient( 
-        {
-            "restaurant":{
-                "url": "http://127.0.0.1:8002/mcp", 
-                "transport": "streamable_http",
-            },
-            "Parking":{
-                "url": "http://127.0.0.1:8003/mcp", 
-                "transport": "streamable_http",
-            }
-        }
-    )
-    tools=await client.get_tools()
-    agent=create_react_agent(
-        llm, tools
-    )
-    # Generate section
-    result = await agent.ainvoke({
-        "messages": [
-            SystemMessage(
-                content="Using the provided topic and description, write a complete and well-structured section of words 100 to 150 for a restaurant report. Include relevant details and also the tools if needed. Use markdown formatting."
-            ),
-            HumanMessage(
-                content=f"Here is the section name: {state['section'].name} and description: {state['section'].description}"
-            )
-        ]
-    })
+    agent=await get_section_agent()
+    section=state['section']
+    # The prefetched dossier answers most questions, so tools are only needed for what it lacks
+    dossier_messages=[SystemMessage(
+        content=f"Prefetched data about the restaurant (use it first, call tools only for information that is missing):\n\n{state['dossier']}"
+    )] if state.get('dossier') else []
+    # Generate section; at most REPORT_MAX_CONCURRENCY run at once and each has its own deadline
+    async with section_slots():
+        try:
+            result = await asyncio.wait_for(agent.ainvoke({
+                "messages": [
+                    SystemMessage(
+                        content="Using the provided topic and description, write a complete and well-structured section of words 100 to 150 for a restaurant report. Include relevant details and also the tools if needed. Use markdown formatting."
+                    ),
+                    *dossier_messages,
+                    HumanMessage(
+                        content=f"Here is the section name: {section.name} and description: {section.description}"
+                    )
+                ]
+            }), REPORT_SECTION_TIMEOUT)
+        except asyncio.TimeoutError:
+            print(f"Section '{section.name}' timed out after {REPORT_SECTION_TIMEOUT}s")
+            return {"completed_sections": [f"## {section.name}\n\n*This section could not be generated in time.*"]}
     
     # Extract the final message content from the agent response
     if isinstance(result, dict) and 'messages' in result:
@@ -140,7 +202,7 @@ def assign_workers(state: State):
     """Assign a worker to each section in the plan"""
 
     # Kick off section writing in parallel via Send() API
-    return [Send("llm_call", {"section": s}) for s in state["sections"]]
+    return [Send("llm_call", {"section": s, "dossier": state.get("dossier", "")}) for s in state["sections"]]
 
 def synthesizer(state: State):
     """Synthesize full report from sections"""
@@ -156,9 +218,9 @@ def synthesizer(state: State):
 def export_markdown(state: State):
     """Export the final report to a markdown file"""
     
-    # Create filename with timestamp
+    # Create filename with timestamp, unless the caller named the report (batch runs do, to avoid collisions)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"report_{timestamp}.md"
+    filename = f"{state['report_name']}.md" if state.get('report_name') else f"report_{timestamp}.md"
     
     # Create the full markdown content with title
     markdown_content = f"# {state['topic']}\n\n"
@@ -186,14 +248,16 @@ orchestrator_worker_builder = StateGraph(State)
 
 # Add the nodes
 orchestrator_worker_builder.add_node("orchestrator", orchestrator)
+orchestrator_worker_builder.add_node("prefetch_dossier", prefetch_dossier)
 orchestrator_worker_builder.add_node("llm_call", llm_call)
 orchestrator_worker_builder.add_node("synthesizer", synthesizer)
 orchestrator_worker_builder.add_node("export_markdown", export_markdown)
 
 # Add edges to connect nodes
 orchestrator_worker_builder.add_edge(START, "orchestrator")
+orchestrator_worker_builder.add_edge("orchestrator", "prefetch_dossier")
 orchestrator_worker_builder.add_conditional_edges(
-    "orchestrator", assign_workers, ["llm_call"]
+    "prefetch_dossier", assign_workers, ["llm_call"]
 )
 orchestrator_worker_builder.add_edge("llm_call", "synthesizer")
 orchestrator_worker_builder.add_edge("synthesizer", "export_markdown")
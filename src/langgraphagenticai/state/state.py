@@ -1,4 +1,4 @@
-from typing_extensions import TypedDict,List
+from typing_extensions import TypedDict,List,NotRequired
 from langgraph.graph.message import add_messages
 from typing import Annotated
 
@@ -8,4 +8,6 @@ class State(TypedDict):
     Represent the structure of the state used in graph, 
     add_messages is a function that adds messages to the state for history of the conversation
     """
-    messages: Annotated[List,add_messages]
\ No newline at end of file
+    messages: Annotated[List,add_messages]
+    retrieved_info: NotRequired[str]  #Long term memory retrieved once per turn and shared by the chatbot and store steps
+    result: NotRequired[bool]  #evaluate_node verdict used to route to store_node or search_node
@@ -3,9 +3,59 @@ import dotenv
 from typing import Dict, Optional, List
 dotenv.load_dotenv()
 import os
+import sys
 import json
+import threading
 from pathlib import Path
 
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent.parent
+sys.path.append(str(project_root))
+from src.langgraphagenticai.tools.restaurant_catalog import get_restaurant_catalog
+from src.langgraphagenticai.tools.ttl_cache import PersistentTTLCache
+from src.langgraphagenticai.tools.http_client import get_http_client
+
+PLACES_API_URL = "https://maps.googleapis.com/maps/api/place"
+
+PLACE_FIELDS = ["name", "formatted_address", "rating", "user_ratings_total",
+                "price_level", "opening_hours", "formatted_phone_number",
+                "website", "reviews", "geometry"]
+
+# Reviews change slowly: serve cached details for hours and stale ones for days while refreshing
+places_cache = PersistentTTLCache(
+    os.getenv("PLACES_CACHE_PATH", str(project_root / ".cache" / "places.sqlite")),
+    ttl=float(os.getenv("PLACES_CACHE_TTL", 6 * 3600)),
+    stale_ttl=float(os.getenv("PLACES_CACHE_STALE_TTL", 7 * 24 * 3600)),
+    name="places_cache"
+)
+# "What's nearby" goes stale quickly: an hour fresh, then at most 15 minutes served while refreshing
+NEARBY_CACHE_TTL = float(os.getenv("PLACES_NEARBY_CACHE_TTL", 3600))
+NEARBY_CACHE_STALE_TTL = float(os.getenv("PLACES_NEARBY_CACHE_STALE_TTL", 15 * 60))
+
+_gmaps_client = None
+_gmaps_key = None
+_gmaps_lock = threading.Lock()
+
+def get_gmaps_client() -> googlemaps.Client:
+    """
+    Return a shared googlemaps client, recreated only if the API key changes.
+    """
+    global _gmaps_client, _gmaps_key
+    api_key = os.getenv("GOOGLE_MAP_API")
+    if not api_key:
+        raise ValueError("Google Maps API key not found in environment variables")
+    with _gmaps_lock:
+        if _gmaps_client is None or _gmaps_key != api_key:
+            _gmaps_client = googlemaps.Client(key=api_key)
+            _gmaps_key = api_key
+        return _gmaps_client
+
+def _google_api_key() -> str:
+    api_key = os.getenv("GOOGLE_MAP_API")
+    if not api_key:
+        raise ValueError("Google Maps API key not found in environment variables")
+    return api_key
+
 def process_reviews(place_data: dict) -> dict:
     """
     Process place data to extract simplified review information.
@@ -34,53 +84,53 @@ def process_reviews(place_data: dict) -> dict:
     
     return simplified_data
 
+def fetch_place_details(place_id: str) -> Dict:
+    """
+    Fetch place details from the Places API, bypassing the cache.
+    """
+    place = get_gmaps_client().place(place_id=place_id, fields=PLACE_FIELDS)
+    return process_reviews(place["result"])
+
 def get_place_details_by_id(place_id: str) -> Optional[Dict]:
     """
     Get detailed information about a place using its Place ID.
     """
     try:
-        api_key = os.getenv("GOOGLE_MAP_API")
-        if not api_key:
-            raise ValueError("Google Maps API key not found in environment variables")
-            
-        gmaps = googlemaps.Client(key=api_key)
-        
-        place = gmaps.place(
-            place_id=place_id,
-            fields=["name", "formatted_address", "rating", "user_ratings_total", 
-                   "price_level", "opening_hours", "formatted_phone_number", 
-                   "website", "reviews", "geometry"]
-        )
-        
-        return process_reviews(place["result"])
+        return places_cache.get_or_load(f"details:{place_id}", lambda: fetch_place_details(place_id))
         
     except Exception as e:
         print(f"Error fetching place details: {str(e)}")
         return None
 
+def fetch_nearby_places(lat: float, lng: float, radius: int, place_type: str = "restaurant") -> Dict:
+    """
+    Search the Places API for places near a location, bypassing the cache.
+    """
+    places = get_gmaps_client().places_nearby(
+        location=(lat, lng),
+        radius=radius,
+        type=place_type,
+        keyword="sushi"
+    )
+    
+    return {
+        'results': places.get('results', []),
+        'status': places.get('status')
+    }
+
 def search_nearby_places(lat: float, lng: float, radius: int, place_type: str = "restaurant") -> Dict:
     """
     Search for places near a specific location.
     """
     try:
-        api_key = os.getenv("GOOGLE_MAP_API")
-        if not api_key:
-            raise ValueError("Google Maps API key not found in environment variables")
-            
-        gmaps = googlemaps.Client(key=api_key)
-        
-        places = gmaps.places_nearby(
-            location=(lat, lng),
-            radius=radius,
-            type=place_type,
-            keyword="sushi"
+        # ~10 m rounding lets repeated searches around the same spot share an entry
+        key = f"nearby:{round(lat, 4)}:{round(lng, 4)}:{radius}:{place_type}"
+        return places_cache.get_or_load(
+            key, lambda: fetch_nearby_places(lat, lng, radius, place_type),
+            ttl=NEARBY_CACHE_TTL, stale_ttl=NEARBY_CACHE_STALE_TTL,
+            should_cache=lambda result: result.get("status") in ("OK", "ZERO_RESULTS")
         )
         
-        return {
-            'results': places.get('results', []),
-            'status': places.get('status')
-        }
-        
     except Exception as e:
         print(f"Error searching nearby places: {str(e)}")
         return {"error": str(e)}
@@ -90,27 +140,83 @@ def get_reviews_for_restaurant(restaurant_name: str) -> Optional[Dict]:
     Fetch reviews for a given restaurant name from Google Maps API.
     """
     try:
-        current_file = Path(__file__)
-        project_root = current_file.parent.parent.parent.parent
-        sushi_file = project_root / 'data' / 'sushi.json'
+        place_id = get_restaurant_catalog().place_id(restaurant_name)
+        if not place_id:
+            raise ValueError(f"Could not find place_id for restaurant: {restaurant_name}")
+
+        return get_place_details_by_id(place_id)
         
-        if not sushi_file.exists():
-            raise FileNotFoundError(f"Could not find sushi.json at {sushi_file}")
+    except Exception as e:
+        print(f"Error fetching reviews: {str(e)}")
+        return None
 
-        with open(sushi_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+async def afetch_place_details(place_id: str) -> Dict:
+    """
+    Async Places API details request on the shared HTTP pool, bypassing the cache.
+    """
+    place = await get_http_client().get_json(f"{PLACES_API_URL}/details/json", params={
+        "place_id": place_id,
+        "fields": ",".join(PLACE_FIELDS),
+        "key": _google_api_key(),
+    })
+    if place.get("status") != "OK":
+        raise ValueError(f"Places API returned {place.get('status')}: {place.get('error_message', '')}")
+    return process_reviews(place["result"])
 
-        place_id = None
-        for item in data:
-            if item.get('title') == restaurant_name:
-                place_id = item.get('contactInfo', {}).get('place_id')
-                break
-        
+async def aget_place_details_by_id(place_id: str) -> Optional[Dict]:
+    """
+    Async variant of get_place_details_by_id sharing the same cache.
+    """
+    try:
+        return await places_cache.aget_or_load(f"details:{place_id}", lambda: afetch_place_details(place_id))
+
+    except Exception as e:
+        print(f"Error fetching place details: {str(e)}")
+        return None
+
+async def afetch_nearby_places(lat: float, lng: float, radius: int, place_type: str = "restaurant") -> Dict:
+    """
+    Async Places API nearby search on the shared HTTP pool, bypassing the cache.
+    """
+    places = await get_http_client().get_json(f"{PLACES_API_URL}/nearbysearch/json", params={
+        "location": f"{lat},{lng}",
+        "radius": radius,
+        "type": place_type,
+        "keyword": "sushi",
+        "key": _google_api_key(),
+    })
+    return {
+        'results': places.get('results', []),
+        'status': places.get('status')
+    }
+
+async def asearch_nearby_places(lat: float, lng: float, radius: int, place_type: str = "restaurant") -> Dict:
+    """
+    Async variant of search_nearby_places sharing the same cache.
+    """
+    try:
+        key = f"nearby:{round(lat, 4)}:{round(lng, 4)}:{radius}:{place_type}"
+        return await places_cache.aget_or_load(
+            key, lambda: afetch_nearby_places(lat, lng, radius, place_type),
+            ttl=NEARBY_CACHE_TTL, stale_ttl=NEARBY_CACHE_STALE_TTL,
+            should_cache=lambda result: result.get("status") in ("OK", "ZERO_RESULTS")
+        )
+
+    except Exception as e:
+        print(f"Error searching nearby places: {str(e)}")
+        return {"error": str(e)}
+
+async def aget_reviews_for_restaurant(restaurant_name: str) -> Optional[Dict]:
+    """
+    Async variant of get_reviews_for_restaurant.
+    """
+    try:
+        place_id = get_restaurant_catalog().place_id(restaurant_name)
         if not place_id:
             raise ValueError(f"Could not find place_id for restaurant: {restaurant_name}")
 
-        return get_place_details_by_id(place_id)
-        
+        return await aget_place_details_by_id(place_id)
+
     except Exception as e:
         print(f"Error fetching reviews: {str(e)}")
         return None
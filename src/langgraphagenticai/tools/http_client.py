@@ -0,0 +1,95 @@
+import asyncio
+import os
+import threading
+import time
+import weakref
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.langgraphagenticai.utils.metrics import HTTP_LATENCY
+
+
+class _LoopClient:
+    """httpx client and per-host semaphores owned by one event loop."""
+    def __init__(self, max_connections: int, timeout: httpx.Timeout):
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout,
+        )
+        self.host_slots: Dict[str, asyncio.Semaphore] = {}
+
+
+class AsyncHTTPClient:
+    """
+    Shared, pooled async HTTP client for the MCP tool backends.
+    Connections are kept alive across tool calls, each upstream host gets at most
+    max_per_host concurrent requests, and every request has a timeout, so one slow
+    upstream cannot starve the others.
+    """
+    def __init__(self, max_connections: int = 100, max_per_host: int = 10, timeout: float = 10.0):
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.timeout = httpx.Timeout(timeout, connect=min(timeout, 5.0))
+        self._loops = weakref.WeakKeyDictionary()  # event loop -> _LoopClient
+        self._lock = threading.Lock()
+
+    def _loop_client(self) -> _LoopClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._loops.get(loop)
+            if state is None:
+                state = _LoopClient(self.max_connections, self.timeout)
+                self._loops[loop] = state
+            return state
+
+    async def get_json(self, url: str, params: Optional[Dict] = None):
+        """
+        GET a URL and return the decoded JSON body.
+        Raises httpx.HTTPStatusError for non-2xx responses.
+        """
+        state = self._loop_client()
+        host = urlsplit(url).netloc
+        slots = state.host_slots.get(host)
+        if slots is None:
+            slots = state.host_slots.setdefault(host, asyncio.Semaphore(self.max_per_host))
+        started = time.perf_counter()
+        status = "error"  # Timeouts and connection errors have no status code
+        try:
+            async with slots:
+                resp = await state.client.get(url, params=params)
+            status = str(resp.status_code)
+        finally:
+            HTTP_LATENCY.observe(time.perf_counter() - started, host=host, status=status)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def aclose(self):
+        """Close the client owned by the current event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._loops.pop(loop, None)
+        if state is not None:
+            await state.client.aclose()
+
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> AsyncHTTPClient:
+    """
+    Return the process-wide async HTTP client.
+    HTTP_MAX_CONNECTIONS, HTTP_MAX_PER_HOST and HTTP_TIMEOUT tune the pool.
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = AsyncHTTPClient(
+                    max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", 100)),
+                    max_per_host=int(os.getenv("HTTP_MAX_PER_HOST", 10)),
+                    timeout=float(os.getenv("HTTP_TIMEOUT", 10)),
+                )
+    return _http_client
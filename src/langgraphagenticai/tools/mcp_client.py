@@ -0,0 +1,330 @@
+import asyncio
+import importlib
+import json
+import os
+import threading
+import weakref
+from typing import Dict, List, Optional
+
+import anyio
+import httpx
+from langchain_core.tools import BaseTool
+from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, CallToolResult, TextContent
+
+from src.langgraphagenticai.utils.metrics import MCP_CALL_LATENCY, MCP_GET_TOOLS_LATENCY
+
+# MCP servers started by the Streamlit app (see ui/streamlitui/loadui.py)
+MCP_CONNECTIONS = {
+    "restaurant": {
+        "url": "http://127.0.0.1:8002/mcp",
+        "transport": "streamable_http",
+    },
+    "Parking": {
+        "url": "http://127.0.0.1:8003/mcp",
+        "transport": "streamable_http",
+    }
+}
+
+# Modules defining the FastMCP servers above, loaded directly with MCP_TRANSPORT=inprocess
+MCP_SERVER_MODULES = {
+    "restaurant": "src.langgraphagenticai.tools.mcp_restaurant",
+    "Parking": "src.langgraphagenticai.tools.mcp_parking",
+}
+
+
+def mcp_transport() -> str:
+    """
+    MCP_TRANSPORT: "http" (default) talks to the servers over streamable HTTP,
+    "inprocess" calls the same FastMCP tools inside this process.
+    """
+    return os.getenv("MCP_TRANSPORT", "http").lower()
+
+
+# Code the streamable HTTP client reports when the server no longer knows the session (server restarted)
+SESSION_TERMINATED = 32600
+
+
+def is_connection_error(error: BaseException) -> bool:
+    """
+    True for failures of the connection or session itself, after which the call
+    never reached the tool and can safely be sent again on a new session.
+    """
+    if isinstance(error, BaseExceptionGroup):
+        return any(is_connection_error(inner) for inner in error.exceptions)
+    if isinstance(error, McpError):
+        return error.error.code in (CONNECTION_CLOSED, SESSION_TERMINATED)
+    return isinstance(error, (httpx.TransportError, anyio.ClosedResourceError, anyio.BrokenResourceError,
+                              anyio.EndOfStream, ConnectionError))
+
+
+class _ServerSession:
+    """
+    Stand-in session handed to the LangChain tools.
+    Each call is routed to the live session of the current event loop. A call
+    that failed because the connection or session died (e.g. after a server
+    restart) reconnects once and is retried; timeouts and tool errors are raised
+    as they are, since the tool may already have run.
+    """
+    def __init__(self, manager: "MCPClientManager", server_name: str):
+        self.manager = manager
+        self.server_name = server_name
+
+    async def call_tool(self, name, arguments=None, **kwargs):
+        with MCP_CALL_LATENCY.time(server=self.server_name):
+            session = await self.manager._session(self.server_name)
+            try:
+                return await asyncio.wait_for(
+                    session.call_tool(name, arguments, **kwargs), self.manager.call_timeout
+                )
+            except Exception as e:
+                if not is_connection_error(e):
+                    raise
+                print(f"MCP call to {self.server_name}.{name} failed ({e!r}), reconnecting")
+                session = await self.manager._reconnect(self.server_name, session)
+                return await asyncio.wait_for(
+                    session.call_tool(name, arguments, **kwargs), self.manager.call_timeout
+                )
+
+
+class _LoopSessions:
+    """Open MCP sessions owned by one event loop."""
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.sessions: Dict[str, object] = {}
+        self.stops: Dict[str, asyncio.Event] = {}
+        self.owners: Dict[str, asyncio.Task] = {}
+
+
+class MCPClientManager:
+    """
+    Process-wide MCP client shared by all graph nodes.
+    The tool list is fetched once and cached; sessions stay open for the lifetime
+    of the event loop that uses them instead of being created per message.
+    """
+    def __init__(self, connections: Dict = MCP_CONNECTIONS, call_timeout: float = 60.0):
+        self.connections = connections
+        self.client = MultiServerMCPClient(connections)
+        self.call_timeout = call_timeout
+        self._tools: Optional[List[BaseTool]] = None
+        self._server_tools: Dict[str, List[BaseTool]] = {}
+        self._tool_names: Dict[str, List[str]] = {}
+        self._loops = weakref.WeakKeyDictionary()  # event loop -> _LoopSessions
+        self._loops_lock = threading.Lock()
+
+    def _loop_sessions(self) -> _LoopSessions:
+        loop = asyncio.get_running_loop()
+        with self._loops_lock:
+            state = self._loops.get(loop)
+            if state is None:
+                state = _LoopSessions()
+                self._loops[loop] = state
+            return state
+
+    async def _hold_session(self, server_name: str, ready: asyncio.Future, stop: asyncio.Event):
+        """
+        Owner task for one server session. The transport's context managers must be
+        entered and exited by the same task, so the session lives inside this task
+        until it is told to stop.
+        """
+        try:
+            async with self.client.session(server_name) as session:
+                ready.set_result(session)
+                await stop.wait()
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+
+    async def _open(self, state: _LoopSessions, server_name: str):
+        ready = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+        owner = asyncio.create_task(self._hold_session(server_name, ready, stop))
+        session = await ready
+        state.sessions[server_name] = session
+        state.stops[server_name] = stop
+        state.owners[server_name] = owner
+        return session
+
+    async def _close(self, state: _LoopSessions, server_name: str):
+        state.sessions.pop(server_name, None)
+        stop = state.stops.pop(server_name, None)
+        owner = state.owners.pop(server_name, None)
+        if stop is not None:
+            stop.set()
+        if owner is not None:
+            try:
+                await asyncio.wait_for(owner, 5)
+            except Exception:
+                owner.cancel()
+
+    async def _session(self, server_name: str):
+        state = self._loop_sessions()
+        session = state.sessions.get(server_name)
+        if session is not None:
+            return session
+        async with state.lock:
+            session = state.sessions.get(server_name)
+            if session is None:
+                session = await self._open(state, server_name)
+            return session
+
+    async def _reconnect(self, server_name: str, failed_session):
+        """
+        Replace a broken session and re-list the server's tools, since a restarted
+        server may expose a different tool set.
+        """
+        state = self._loop_sessions()
+        async with state.lock:
+            session = state.sessions.get(server_name)
+            if session is None or session is failed_session:
+                await self._close(state, server_name)
+                session = await self._open(state, server_name)
+                await self._load_server_tools(server_name, session)
+            return session
+
+    async def _load_server_tools(self, server_name: str, session) -> List[BaseTool]:
+        mcp_tools = []
+        cursor = None
+        while True:
+            page = await session.list_tools(cursor=cursor)
+            mcp_tools.extend(page.tools)
+            cursor = page.nextCursor
+            if not cursor:
+                break
+
+        names = [tool.name for tool in mcp_tools]
+        if names != self._tool_names.get(server_name):
+            proxy = _ServerSession(self, server_name)
+            self._server_tools[server_name] = [
+                convert_mcp_tool_to_langchain_tool(proxy, tool) for tool in mcp_tools
+            ]
+            self._tool_names[server_name] = names
+            self._tools = None
+        return self._server_tools[server_name]
+
+    async def get_tools(self, refresh: bool = False) -> List[BaseTool]:
+        """
+        Return the LangChain tools of all configured MCP servers.
+        Args:
+            refresh (bool): Re-list the tools from the servers instead of using the cache
+        Returns:
+            List[BaseTool]: Tools that can be passed to create_react_agent
+        """
+        if self._tools is not None and not refresh:
+            return self._tools
+
+        with MCP_GET_TOOLS_LATENCY.time():
+            return await self._load_tools(refresh)
+
+    async def _load_tools(self, refresh: bool) -> List[BaseTool]:
+        for server_name in self.connections:
+            if refresh or server_name not in self._server_tools:
+                try:
+                    session = await self._session(server_name)
+                    await self._load_server_tools(server_name, session)
+                except Exception as e:
+                    # Keep the other servers usable; this one is retried on the next call
+                    print(f"Could not load tools from MCP server '{server_name}': {e!r}")
+                    self._server_tools.pop(server_name, None)
+                    self._tool_names.pop(server_name, None)
+
+        if not self._server_tools:
+            raise RuntimeError("No MCP server is reachable")
+        tools = [tool for server_tools in self._server_tools.values() for tool in server_tools]
+        if len(self._server_tools) == len(self.connections):
+            self._tools = tools
+        return tools
+
+    async def aclose(self):
+        """Close the sessions owned by the current event loop."""
+        state = self._loop_sessions()
+        async with state.lock:
+            for server_name in list(state.sessions):
+                await self._close(state, server_name)
+
+
+class _InProcessSession:
+    """
+    Session stand-in that calls a FastMCP server in this process.
+    The tools still go through FastMCP's argument validation and result
+    conversion, so agents see the same schemas and outputs as over HTTP,
+    without JSON-RPC serialization or a network round trip.
+    """
+    def __init__(self, server_name: str, server):
+        self.server_name = server_name
+        self.server = server
+
+    async def call_tool(self, name, arguments=None, **kwargs) -> CallToolResult:
+        with MCP_CALL_LATENCY.time(server=self.server_name):
+            try:
+                result = await self.server.call_tool(name, arguments or {})
+            except Exception as e:
+                # Same shape as a failed call over HTTP; the adapter raises it as a ToolException
+                return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
+        if isinstance(result, tuple):
+            content, structured = result
+            return CallToolResult(content=list(content), structuredContent=structured)
+        if isinstance(result, dict):
+            return CallToolResult(content=[TextContent(type="text", text=json.dumps(result))], structuredContent=result)
+        return CallToolResult(content=list(result))
+
+
+class InProcessMCPManager:
+    """
+    Drop-in replacement for MCPClientManager for single-process deployments:
+    the FastMCP servers are imported and their tools are converted with the same
+    adapter as the HTTP tools. No MCP server processes are needed.
+    """
+    def __init__(self, modules: Dict[str, str] = MCP_SERVER_MODULES):
+        self.modules = modules
+        self._tools: Optional[List[BaseTool]] = None
+
+    async def get_tools(self, refresh: bool = False) -> List[BaseTool]:
+        """
+        Return the LangChain tools of all in-process MCP servers.
+        Args:
+            refresh (bool): Re-list the tools instead of using the cache
+        Returns:
+            List[BaseTool]: Tools that can be passed to create_react_agent
+        """
+        if self._tools is not None and not refresh:
+            return self._tools
+
+        with MCP_GET_TOOLS_LATENCY.time():
+            tools = []
+            for server_name, module in self.modules.items():
+                server = importlib.import_module(module).mcp
+                session = _InProcessSession(server_name, server)
+                tools += [convert_mcp_tool_to_langchain_tool(session, tool) for tool in await server.list_tools()]
+            self._tools = tools
+        return tools
+
+    async def aclose(self):
+        """Nothing to close; kept for parity with MCPClientManager."""
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_mcp_client_manager():
+    """
+    Return the process-wide MCP client manager for the configured MCP_TRANSPORT:
+    MCPClientManager over HTTP or InProcessMCPManager.
+    """
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                transport = mcp_transport()
+                if transport == "inprocess":
+                    _manager = InProcessMCPManager()
+                elif transport == "http":
+                    _manager = MCPClientManager()
+                else:
+                    raise ValueError(f"Unknown MCP_TRANSPORT '{transport}', expected 'http' or 'inprocess'")
+    return _manager
@@ -1,4 +1,3 @@
-import json
 import sys
 import requests
 from pathlib import Path
@@ -12,7 +11,12 @@ project_root = current_file.parent.parent.parent.parent
 sys.path.append(str(project_root))
 
 
+from src.langgraphagenticai.tools.parking_store import get_parking_store
+from src.langgraphagenticai.tools.restaurant_catalog import get_restaurant_catalog
+
 mcp=FastMCP("Parking near restaurant", port=8003)
+parking_store=get_parking_store() #Views are rebuilt only when data/parking.json changes
+catalog=get_restaurant_catalog()
 
 @mcp.tool()
 def get_parking_data() -> dict:
@@ -21,8 +25,7 @@ def get_parking_data() -> dict:
     Returns:
         dict: The details about the available parking spaces in Munich.
     """
-    with open(project_root / "data/parking.json", "r", encoding="utf-8") as f:
-        return json.load(f)
+    return parking_store.all()
 
 @mcp.tool()
 def get_open_parking_lots() -> List[Dict]:
@@ -32,25 +35,7 @@ def get_open_parking_lots() -> List[Dict]:
         List[Dict]: Currently open parking lots with details
     """
     try:
-        with open(project_root / "data/parking.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        open_lots = []
-        for lot in data:
-            business_hours = lot.get("businessHours", {})
-            if business_hours.get("currentStatus") == "OPEN":
-                open_lots.append({
-                    "title": lot.get("title"),
-                    "address": lot.get("address"),
-                    "distance": lot.get("distance_from_current_location"),
-                    "duration": lot.get("duration_from_current_location"),
-                    "price_summary": lot.get("priceSummary", {}).get("priceSummaryText"),
-                    "free_spots": lot.get("parking", {}).get("freeSpotsNumber"),
-                    "total_spots": lot.get("parking", {}).get("spotsNumber"),
-                    "next_status_change": business_hours.get("nextStatusChange")
-                })
-        
-        return open_lots
+        return parking_store.open_lots()
     except Exception as e:
         return [{"error": str(e)}]
 
@@ -62,26 +47,7 @@ def get_parking_with_free_spots() -> List[Dict]:
         List[Dict]: Parking lots with available spots
     """
     try:
-        with open(project_root / "data/parking.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        available_lots = []
-        for lot in data:
-            parking_info = lot.get("parking", {})
-            free_spots = parking_info.get("freeSpotsNumber")
-            
-            if free_spots and free_spots > 0:
-                available_lots.append({
-                    "title": lot.get("title"),
-                    "address": lot.get("address"),
-                    "free_spots": free_spots,
-                    "total_spots": parking_info.get("spotsNumber"),
-                    "availability_percentage": round((free_spots / parking_info.get("spotsNumber", 1)) * 100, 1),
-                    "distance": lot.get("distance_from_current_location"),
-                    "price_summary": lot.get("priceSummary", {}).get("priceSummaryText")
-                })
-        
-        return sorted(available_lots, key=lambda x: x["free_spots"], reverse=True)
+        return parking_store.with_free_spots()
     except Exception as e:
         return [{"error": str(e)}]
     
@@ -94,25 +60,7 @@ def get_24_hour_parking() -> List[Dict]:
         List[Dict]: 24-hour parking lots
     """
     try:
-        with open(project_root / "data/parking.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        all_day_lots = []
-        for lot in data:
-            business_hours = lot.get("businessHours", {})
-            formatted_hours = business_hours.get("formattedHours", [])
-            
-            if any("24 hours" in hour for hour in formatted_hours):
-                all_day_lots.append({
-                    "title": lot.get("title"),
-                    "address": lot.get("address"),
-                    "distance": lot.get("distance_from_current_location"),
-                    "price_summary": lot.get("priceSummary", {}).get("priceSummaryText"),
-                    "free_spots": lot.get("parking", {}).get("freeSpotsNumber"),
-                    "payment_methods": lot.get("paymentMethods", [])
-                })
-        
-        return all_day_lots
+        return parking_store.all_day()
     except Exception as e:
         return [{"error": str(e)}]
     
@@ -124,25 +72,7 @@ def get_parking_with_disabled_access() -> List[Dict]:
         List[Dict]: Parking lots with disabled access
     """
     try:
-        with open(project_root / "data/parking.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        disabled_lots = []
-        for lot in data:
-            parking_info = lot.get("parking", {})
-            services = parking_info.get("services", [])
-            
-            if "DISABLED" in services:
-                disabled_lots.append({
-                    "title": lot.get("title"),
-                    "address": lot.get("address"),
-                    "disabled_spots": parking_info.get("disabledSpotsNumber"),
-                    "total_spots": parking_info.get("spotsNumber"),
-                    "distance": lot.get("distance_from_current_location"),
-                    "price_summary": lot.get("priceSummary", {}).get("priceSummaryText")
-                })
-        
-        return disabled_lots
+        return parking_store.with_disabled_access()
     except Exception as e:
         return [{"error": str(e)}]
 
@@ -154,22 +84,33 @@ def get_parking_payment_methods() -> Dict:
         Dict: Payment methods and which lots accept them
     """
     try:
-        with open(project_root / "data/parking.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        payment_methods = {}
-        for lot in data:
-            methods = lot.get("paymentMethods", [])
-            for method in methods:
-                if method not in payment_methods:
-                    payment_methods[method] = []
-                payment_methods[method].append({
-                    "title": lot.get("title"),
-                    "address": lot.get("address"),
-                    "distance": lot.get("distance_from_current_location")
-                })
-        
-        return payment_methods
+        return parking_store.payment_methods()
+    except Exception as e:
+        return {"error": str(e)}
+
+@mcp.tool()
+def get_parking_near_restaurant(restaurant_name: str, k: int = 3, max_meters: float = 1000) -> Dict:
+    """
+    Get the parking lots closest to a specific restaurant.
+    Args:
+        restaurant_name (str): The name of the restaurant
+        k (int): Maximum number of parking lots to return (default: 3)
+        max_meters (float): Only include lots within this walking radius in meters (default: 1000)
+    Returns:
+        Dict: The restaurant and its nearest parking lots with distances in meters
+    """
+    try:
+        restaurant = catalog.get(restaurant_name)
+        if restaurant is None:
+            return {"error": f"Restaurant '{restaurant_name}' not found"}
+        position = restaurant.get("position", {})
+        if position.get("lat") is None or position.get("lng") is None:
+            return {"error": f"Restaurant '{restaurant_name}' has no position"}
+        return {
+            "restaurant": restaurant_name,
+            "address": restaurant.get("address"),
+            "parking": parking_store.nearest(float(position["lat"]), float(position["lng"]), k, max_meters)
+        }
     except Exception as e:
         return {"error": str(e)}
 
@@ -1,4 +1,3 @@
-import json
 import sys
 import requests
 from pathlib import Path
@@ -10,14 +9,18 @@ current_file = Path(__file__).resolve()
 project_root = current_file.parent.parent.parent.parent
 sys.path.append(str(project_root))
 
-from src.langgraphagenticai.tools.google_map_review import search_nearby_places
-from src.langgraphagenticai.tools.google_map_review import get_place_details_by_id
-from src.langgraphagenticai.tools.google_map_review import get_reviews_for_restaurant
+from src.langgraphagenticai.tools.google_map_review import asearch_nearby_places
+from src.langgraphagenticai.tools.google_map_review import aget_place_details_by_id
+from src.langgraphagenticai.tools.google_map_review import aget_reviews_for_restaurant
+from src.langgraphagenticai.tools.restaurant_catalog import get_restaurant_catalog
+from src.langgraphagenticai.tools.weather_info import aget_weather_for_restaurant
+from src.langgraphagenticai.tools.weather_info import aget_weather_for_restaurants
 
 mcp=FastMCP("Sushi restaurant", port=8002)
+catalog=get_restaurant_catalog() #Parsed once, reloaded only when data/sushi.json changes
 
 @mcp.tool()
-def get_googlereviews(restaurant_name: str) -> dict:
+async def get_googlereviews(restaurant_name: str) -> dict:
     """
     Get the latest Google reviews for the given restaurant name.
     Args:
@@ -26,7 +29,7 @@ def get_googlereviews(restaurant_name: str) -> dict:
         dict: The reviews for the given restaurant name.
     """
     try:
-        result = get_reviews_for_restaurant(restaurant_name)
+        result = await aget_reviews_for_restaurant(restaurant_name)
         if result is None:
             return {"error": f"Could not find reviews for {restaurant_name}"}
         return result
@@ -34,7 +37,7 @@ def get_googlereviews(restaurant_name: str) -> dict:
         return {"error": str(e)}
 
 @mcp.tool()
-def get_place_details(place_id: str) -> dict:
+async def get_place_details(place_id: str) -> dict:
     """
     Get detailed information about a place using Google Places API.
     Args:
@@ -44,12 +47,12 @@ def get_place_details(place_id: str) -> dict:
     """
     try:
         
-        return get_place_details_by_id(place_id)
+        return await aget_place_details_by_id(place_id)
     except Exception as e:
         return {"error": str(e)}
 
 @mcp.tool()
-def search_nearby_restaurants(lat: float, lng: float, radius: int = 1000) -> dict:
+async def search_nearby_restaurants(lat: float, lng: float, radius: int = 1000) -> dict:
     """
     Search for restaurants near a specific location.
     Args:
@@ -61,7 +64,42 @@ def search_nearby_restaurants(lat: float, lng: float, radius: int = 1000) -> dic
     """
     try:
         
-        return search_nearby_places(lat, lng, radius, "restaurant")
+        return await asearch_nearby_places(lat, lng, radius, "restaurant")
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@mcp.tool()
+async def get_weather(restaurant_name: str) -> dict:
+    """
+    Fetch the current weather for a given restaurant.
+    Args:
+        restaurant_name (str): The name of the restaurant.
+    Returns:
+        dict: The current weather at the restaurant.
+    """
+    try:
+        result = await aget_weather_for_restaurant(restaurant_name)
+        if result is None:
+            return {"error": f"Could not fetch weather for {restaurant_name}"}
+        return result
+    except Exception as e:
+        return {"error": str(e)}
+
+@mcp.tool()
+async def get_weather_for_multiple_restaurants(restaurant_names: Optional[List[str]] = None) -> dict:
+    """
+    Fetch the current weather for several restaurants at once, e.g. to compare them.
+    Args:
+        restaurant_names (List[str]): The restaurant names; leave empty for all restaurants.
+    Returns:
+        dict: The current weather for each restaurant, or an error entry for names that were not found.
+    """
+    try:
+        result = await aget_weather_for_restaurants(restaurant_names)
+        if result is None:
+            return {"error": "Could not fetch weather"}
+        return result
     except Exception as e:
         return {"error": str(e)}
 
@@ -75,10 +113,7 @@ def get_restaurant_data(restaurant_name: str) -> Optional[Dict]:
     Returns:
         dict: The details about the given restaurant.
     """
-    with open(project_root / "data/sushi.json", "r", encoding="utf-8") as f:
-        data = json.load(f)
-    matches = [r for r in data if r.get("title") == restaurant_name]
-    return matches[0] if matches else None
+    return catalog.get(restaurant_name)
 
 @mcp.tool()
 def get_all_restaurants() -> List[Dict]:
@@ -87,8 +122,7 @@ def get_all_restaurants() -> List[Dict]:
     Returns:
         List[Dict]: All restaurant information.
     """
-    with open(project_root /"data/sushi.json", "r", encoding="utf-8") as f:
-        return json.load(f)
+    return catalog.all()
 
 @mcp.tool()
 def get_restaurant_names() -> List[str]:
@@ -97,9 +131,7 @@ def get_restaurant_names() -> List[str]:
     Returns:
         List[str]: The list of available sushi restaurant names.
     """
-    with open(project_root /"data/sushi.json", 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return [item['title'] for item in data if 'title' in item]
+    return catalog.names()
 
 @mcp.tool()
 def get_restaurant_menu(restaurant_name: str) -> Dict:
@@ -111,18 +143,10 @@ def get_restaurant_menu(restaurant_name: str) -> Dict:
         dict: Menu items with prices
     """
     try:
-        with open(project_root / "data/sushi.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        for restaurant in data:
-            if restaurant.get("title") == restaurant_name:
-                menu = restaurant.get("menu", {})
-                return {
-                    "restaurant": restaurant_name,
-                    "menu_items": menu.get("items", []),
-                    "total_items": len(menu.get("items", []))
-                }
-        return {"error": f"Restaurant '{restaurant_name}' not found"}
+        menu = catalog.menu(restaurant_name)
+        if menu is None:
+            return {"error": f"Restaurant '{restaurant_name}' not found"}
+        return menu
     except Exception as e:
         return {"error": str(e)}
 
@@ -137,26 +161,7 @@ def get_restaurants_by_price_range(min_price: float, max_price: float) -> List[D
         List[Dict]: Restaurants with items in the price range
     """
     try:
-        with open(project_root / "data/sushi.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        results = []
-        for restaurant in data:
-            menu_items = restaurant.get("menu", {}).get("items", [])
-            affordable_items = [
-                item for item in menu_items 
-                if min_price <= item.get("price", 0) <= max_price
-            ]
-            
-            if affordable_items:
-                results.append({
-                    "restaurant": restaurant.get("title"),
-                    "address": restaurant.get("address"),
-                    "affordable_items": affordable_items,
-                    "item_count": len(affordable_items)
-                })
-        
-        return results
+        return catalog.by_price_range(min_price, max_price)
     except Exception as e:
         return [{"error": str(e)}]
 
@@ -170,20 +175,10 @@ def get_restaurant_contact_info(restaurant_name: str) -> Dict:
         dict: Contact information including phone, email, website
     """
     try:
-        with open(project_root / "data/sushi.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        for restaurant in data:
-            if restaurant.get("title") == restaurant_name:
-                contact_info = restaurant.get("contactInfo", {})
-                return {
-                    "restaurant": restaurant_name,
-                    "phone": contact_info.get("phoneNumber"),
-                    "email": contact_info.get("email"),
-                    "website": contact_info.get("website"),
-                    "address": restaurant.get("address")
-                }
-        return {"error": f"Restaurant '{restaurant_name}' not found"}
+        contact_info = catalog.contact_info(restaurant_name)
+        if contact_info is None:
+            return {"error": f"Restaurant '{restaurant_name}' not found"}
+        return contact_info
     except Exception as e:
         return {"error": str(e)}
 
@@ -197,23 +192,7 @@ def get_restaurants_by_food_type(food_type: str) -> List[Dict]:
         List[Dict]: Restaurants serving the specified food type
     """
     try:
-        with open(project_root / "data/sushi.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        results = []
-        food_type_lower = food_type.lower()
-        
-        for restaurant in data:
-            food_types = restaurant.get("foodTypes", [])
-            if any(food_type_lower in ft.lower() for ft in food_types):
-                results.append({
-                    "restaurant": restaurant.get("title"),
-                    "address": restaurant.get("address"),
-                    "food_types": food_types,
-                    "price_level": restaurant.get("priceSummary", {}).get("priceRangeLevel", "Unknown")
-                })
-        
-        return results
+        return catalog.by_food_type(food_type)
     except Exception as e:
         return [{"error": str(e)}]
 
@@ -0,0 +1,165 @@
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.langgraphagenticai.tools.spatial_index import GridIndex
+from src.langgraphagenticai.tools.versioned_store import VersionedJsonStore
+
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent.parent
+PARKING_DATA_FILE = project_root / "data" / "parking.json"
+
+
+class _ParkingViews:
+    """
+    All derived parking views for one version of the parking file.
+    Built together so a reload swaps every view at once.
+    """
+    def __init__(self, lots: List[Dict], version: Optional[str]):
+        self.version = version
+        self.lots = lots
+        self.open_lots: List[Dict] = []
+        self.free_spots: List[Dict] = []
+        self.all_day_lots: List[Dict] = []
+        self.disabled_access: List[Dict] = []
+        self.payment_methods: Dict[str, List[Dict]] = {}
+
+        for lot in lots:
+            business_hours = lot.get("businessHours", {})
+            parking_info = lot.get("parking", {})
+            price_summary = lot.get("priceSummary", {}).get("priceSummaryText")
+
+            if business_hours.get("currentStatus") == "OPEN":
+                self.open_lots.append({
+                    "title": lot.get("title"),
+                    "address": lot.get("address"),
+                    "distance": lot.get("distance_from_current_location"),
+                    "duration": lot.get("duration_from_current_location"),
+                    "price_summary": price_summary,
+                    "free_spots": parking_info.get("freeSpotsNumber"),
+                    "total_spots": parking_info.get("spotsNumber"),
+                    "next_status_change": business_hours.get("nextStatusChange")
+                })
+
+            free_spots = parking_info.get("freeSpotsNumber")
+            if free_spots and free_spots > 0:
+                self.free_spots.append({
+                    "title": lot.get("title"),
+                    "address": lot.get("address"),
+                    "free_spots": free_spots,
+                    "total_spots": parking_info.get("spotsNumber"),
+                    "availability_percentage": round((free_spots / (parking_info.get("spotsNumber") or 1)) * 100, 1),
+                    "distance": lot.get("distance_from_current_location"),
+                    "price_summary": price_summary
+                })
+
+            if any("24 hours" in hour for hour in business_hours.get("formattedHours", [])):
+                self.all_day_lots.append({
+                    "title": lot.get("title"),
+                    "address": lot.get("address"),
+                    "distance": lot.get("distance_from_current_location"),
+                    "price_summary": price_summary,
+                    "free_spots": parking_info.get("freeSpotsNumber"),
+                    "payment_methods": lot.get("paymentMethods", [])
+                })
+
+            if "DISABLED" in parking_info.get("services", []):
+                self.disabled_access.append({
+                    "title": lot.get("title"),
+                    "address": lot.get("address"),
+                    "disabled_spots": parking_info.get("disabledSpotsNumber"),
+                    "total_spots": parking_info.get("spotsNumber"),
+                    "distance": lot.get("distance_from_current_location"),
+                    "price_summary": price_summary
+                })
+
+            for method in lot.get("paymentMethods", []):
+                self.payment_methods.setdefault(method, []).append({
+                    "title": lot.get("title"),
+                    "address": lot.get("address"),
+                    "distance": lot.get("distance_from_current_location")
+                })
+
+        self.free_spots.sort(key=lambda x: x["free_spots"], reverse=True)
+
+        # Spatial index over the lots that have a position
+        self.located_lots = [
+            lot for lot in lots
+            if lot.get("position", {}).get("lat") is not None and lot.get("position", {}).get("lng") is not None
+        ]
+        self.spatial_index = GridIndex(
+            [(float(lot["position"]["lat"]), float(lot["position"]["lng"])) for lot in self.located_lots]
+        )
+
+
+class ParkingStore(VersionedJsonStore):
+    """
+    Materializes the parking views once per version of data/parking.json.
+    Returned lists and dicts are shared between calls and must be treated as read-only.
+    """
+    def __init__(self, data_file: Path = PARKING_DATA_FILE, check_interval: float = 1.0):
+        super().__init__(data_file, check_interval)
+
+    def _build(self, data, version) -> _ParkingViews:
+        return _ParkingViews(data, version)
+
+    def all(self) -> List[Dict]:
+        return self._current().lots
+
+    def open_lots(self) -> List[Dict]:
+        return self._current().open_lots
+
+    def with_free_spots(self) -> List[Dict]:
+        return self._current().free_spots
+
+    def all_day(self) -> List[Dict]:
+        return self._current().all_day_lots
+
+    def with_disabled_access(self) -> List[Dict]:
+        return self._current().disabled_access
+
+    def payment_methods(self) -> Dict[str, List[Dict]]:
+        return self._current().payment_methods
+
+    def nearest(self, lat: float, lng: float, k: int = 3, max_meters: Optional[float] = None) -> List[Dict]:
+        """
+        Parking lots closest to a coordinate, measured as great-circle distance.
+        Args:
+            lat (float): Latitude
+            lng (float): Longitude
+            k (int): Maximum number of lots to return
+            max_meters (float): Optional distance cut-off in meters
+        Returns:
+            List[Dict]: Lots ordered by distance, each with a distance_meters field
+        """
+        views = self._current()
+        results = []
+        for lot_id, distance in views.spatial_index.nearest(lat, lng, k, max_meters):
+            lot = views.located_lots[lot_id]
+            parking_info = lot.get("parking", {})
+            results.append({
+                "title": lot.get("title"),
+                "address": lot.get("address"),
+                "distance_meters": round(distance, 1),
+                "free_spots": parking_info.get("freeSpotsNumber"),
+                "total_spots": parking_info.get("spotsNumber"),
+                "price_summary": lot.get("priceSummary", {}).get("priceSummaryText"),
+                "current_status": lot.get("businessHours", {}).get("currentStatus")
+            })
+        return results
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_parking_store() -> ParkingStore:
+    """
+    Return the process-wide store for data/parking.json.
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ParkingStore()
+    return _store
@@ -0,0 +1,158 @@
+import bisect
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.langgraphagenticai.tools.versioned_store import VersionedJsonStore
+
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent.parent
+SUSHI_DATA_FILE = project_root / "data" / "sushi.json"
+
+
+class _CatalogSnapshot:
+    """
+    Set of indexes built from one version of the restaurant file.
+    Readers always see a complete snapshot because it is swapped in as a single object.
+    """
+    def __init__(self, restaurants: List[Dict], version: Optional[str]):
+        self.version = version
+        self.restaurants = restaurants
+        self.names = [item["title"] for item in restaurants if "title" in item]
+
+        # Title hash index (first entry wins, same as the old linear scan)
+        self.by_title: Dict[str, Dict] = {}
+        for restaurant in restaurants:
+            title = restaurant.get("title")
+            if title is not None and title not in self.by_title:
+                self.by_title[title] = restaurant
+
+        # Precomputed menu, contact and Google place_id views per title
+        self.menus: Dict[str, Dict] = {}
+        self.contacts: Dict[str, Dict] = {}
+        self.place_ids: Dict[str, str] = {}
+        for title, restaurant in self.by_title.items():
+            items = restaurant.get("menu", {}).get("items", [])
+            self.menus[title] = {
+                "restaurant": title,
+                "menu_items": items,
+                "total_items": len(items)
+            }
+            contact_info = restaurant.get("contactInfo", {})
+            self.contacts[title] = {
+                "restaurant": title,
+                "phone": contact_info.get("phoneNumber"),
+                "email": contact_info.get("email"),
+                "website": contact_info.get("website"),
+                "address": restaurant.get("address")
+            }
+            if contact_info.get("place_id"):
+                self.place_ids[title] = contact_info["place_id"]
+
+        # Inverted index: lower-cased food type -> positions of the restaurants serving it
+        self.by_food_type: Dict[str, List[int]] = {}
+        self.food_type_rows: List[Dict] = []
+        for position, restaurant in enumerate(restaurants):
+            food_types = restaurant.get("foodTypes", [])
+            self.food_type_rows.append({
+                "restaurant": restaurant.get("title"),
+                "address": restaurant.get("address"),
+                "food_types": food_types,
+                "price_level": restaurant.get("priceSummary", {}).get("priceRangeLevel", "Unknown")
+            })
+            for food_type in food_types:
+                positions = self.by_food_type.setdefault(food_type.lower(), [])
+                if not positions or positions[-1] != position:
+                    positions.append(position)
+        self.food_type_queries: Dict[str, List[Dict]] = {}
+
+        # Menu positions sorted by price per restaurant, for bisect-based range queries
+        self.priced_menus: List[tuple] = []
+        for restaurant in restaurants:
+            items = restaurant.get("menu", {}).get("items", [])
+            positions = sorted(range(len(items)), key=lambda position: items[position].get("price", 0))
+            prices = [items[position].get("price", 0) for position in positions]
+            self.priced_menus.append((restaurant, items, prices, positions))
+
+
+class RestaurantCatalog(VersionedJsonStore):
+    """
+    Loads the restaurant file once and serves lookups from in-memory indexes.
+    Returned dicts are shared with the index and must be treated as read-only.
+    """
+    def __init__(self, data_file: Path = SUSHI_DATA_FILE, check_interval: float = 1.0):
+        super().__init__(data_file, check_interval)
+
+    def _build(self, data, version) -> _CatalogSnapshot:
+        return _CatalogSnapshot(data, version)
+
+    def all(self) -> List[Dict]:
+        return self._current().restaurants
+
+    def names(self) -> List[str]:
+        return self._current().names
+
+    def get(self, restaurant_name: str) -> Optional[Dict]:
+        return self._current().by_title.get(restaurant_name)
+
+    def menu(self, restaurant_name: str) -> Optional[Dict]:
+        return self._current().menus.get(restaurant_name)
+
+    def contact_info(self, restaurant_name: str) -> Optional[Dict]:
+        return self._current().contacts.get(restaurant_name)
+
+    def place_id(self, restaurant_name: str) -> Optional[str]:
+        return self._current().place_ids.get(restaurant_name)
+
+    def by_food_type(self, food_type: str) -> List[Dict]:
+        """
+        Restaurants whose food types contain the given text (case-insensitive).
+        Only the distinct food type keys are scanned, never the restaurant records,
+        and the result is memoized on the snapshot for repeated queries.
+        """
+        snapshot = self._current()
+        food_type_lower = food_type.lower()
+        rows = snapshot.food_type_queries.get(food_type_lower)
+        if rows is None:
+            matched = set()
+            for key, positions in snapshot.by_food_type.items():
+                if food_type_lower in key:
+                    matched.update(positions)
+            rows = [snapshot.food_type_rows[position] for position in sorted(matched)]
+            snapshot.food_type_queries[food_type_lower] = rows
+        return rows
+
+    def by_price_range(self, min_price: float, max_price: float) -> List[Dict]:
+        """
+        Restaurants with menu items priced within [min_price, max_price].
+        """
+        results = []
+        for restaurant, items, prices, positions in self._current().priced_menus:
+            low = bisect.bisect_left(prices, min_price)
+            high = bisect.bisect_right(prices, max_price)
+            if low < high:
+                # Items are returned in menu order, as the tool always did
+                affordable_items = [items[position] for position in sorted(positions[low:high])]
+                results.append({
+                    "restaurant": restaurant.get("title"),
+                    "address": restaurant.get("address"),
+                    "affordable_items": affordable_items,
+                    "item_count": len(affordable_items)
+                })
+        return results
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_restaurant_catalog() -> RestaurantCatalog:
+    """
+    Return the process-wide catalog for data/sushi.json.
+    """
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = RestaurantCatalog()
+    return _catalog
@@ -0,0 +1,129 @@
+import math
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_METERS = 6371008.8
+# Same sphere as haversine_meters, so cell sizes and distances agree
+METERS_PER_DEGREE_LAT = EARTH_RADIUS_METERS * math.pi / 180.0
+
+
+def haversine_meters(lat: float, lng: float, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """
+    Great-circle distance in meters from one point to many points.
+    Args:
+        lat (float): Latitude of the origin
+        lng (float): Longitude of the origin
+        lats (np.ndarray): Latitudes of the targets
+        lngs (np.ndarray): Longitudes of the targets
+    Returns:
+        np.ndarray: Distance to every target in meters
+    """
+    lat1 = math.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlng = np.radians(lngs) - math.radians(lng)
+    a = np.sin(dlat / 2.0) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlng / 2.0) ** 2
+    return 2.0 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class GridIndex:
+    """
+    Uniform lat/lng grid over a fixed set of points.
+    Queries only look at the cells around the origin and then rank that
+    candidate set with a vectorized haversine.
+    """
+    def __init__(self, points: Sequence[Tuple[float, float]], cell_meters: float = 500.0):
+        self.cell_meters = cell_meters
+        self.lats = np.array([p[0] for p in points], dtype=np.float64)
+        self.lngs = np.array([p[1] for p in points], dtype=np.float64)
+
+        # Longitude degrees shrink with latitude, so size cells for the data's mean latitude
+        mean_lat = float(self.lats.mean()) if len(points) else 0.0
+        self.cell_lat = cell_meters / METERS_PER_DEGREE_LAT
+        self.cell_lng = cell_meters / (METERS_PER_DEGREE_LAT * max(math.cos(math.radians(mean_lat)), 1e-6))
+
+        buckets: Dict[Tuple[int, int], List[int]] = {}
+        for i in range(len(points)):
+            buckets.setdefault(self._cell(self.lats[i], self.lngs[i]), []).append(i)
+        self.cells = {cell: np.array(ids, dtype=np.intp) for cell, ids in buckets.items()}
+
+        if self.cells:
+            rows = [cell[0] for cell in self.cells]
+            cols = [cell[1] for cell in self.cells]
+            self._bounds = (min(rows), max(rows), min(cols), max(cols))
+
+    def __len__(self) -> int:
+        return len(self.lats)
+
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        return (math.floor(lat / self.cell_lat), math.floor(lng / self.cell_lng))
+
+    def _ring(self, row: int, col: int, radius: int) -> List[np.ndarray]:
+        """Point ids in the square ring of cells at the given Chebyshev radius."""
+        if radius == 0:
+            ids = self.cells.get((row, col))
+            return [ids] if ids is not None else []
+        found = []
+        for r in range(row - radius, row + radius + 1):
+            step = 1 if r in (row - radius, row + radius) else 2 * radius
+            for c in range(col - radius, col + radius + 1, step):
+                ids = self.cells.get((r, c))
+                if ids is not None:
+                    found.append(ids)
+        return found
+
+    def _max_ring(self, row: int, col: int) -> int:
+        min_row, max_row, min_col, max_col = self._bounds
+        return max(abs(row - min_row), abs(row - max_row), abs(col - min_col), abs(col - max_col))
+
+    def _covered(self, row: int, radius: int) -> float:
+        """
+        Distance from any origin in cell row `row` within which every point lies in
+        the rings up to `radius`. Longitude cells are measured at the highest
+        latitude of the searched rows (where they are narrowest), and one ring is
+        kept as margin for the flat-grid approximation of the sphere.
+        """
+        edge_lat = min(max(abs(row - radius), abs(row + radius + 1)) * self.cell_lat, 90.0)
+        lng_meters = self.cell_lng * METERS_PER_DEGREE_LAT * math.cos(math.radians(edge_lat))
+        return max(radius - 1, 0) * min(self.cell_meters, lng_meters)
+
+    def nearest(self, lat: float, lng: float, k: int = 3, max_meters: float = None) -> List[Tuple[int, float]]:
+        """
+        Find the k nearest points to (lat, lng).
+        Args:
+            lat (float): Latitude of the origin
+            lng (float): Longitude of the origin
+            k (int): Maximum number of points to return
+            max_meters (float): Optional distance cut-off in meters
+        Returns:
+            List[Tuple[int, float]]: (point id, distance in meters), closest first
+        """
+        if k <= 0 or not self.cells:
+            return []
+
+        row, col = self._cell(lat, lng)
+        last_ring = self._max_ring(row, col)
+        gathered: List[np.ndarray] = []
+        ids = distances = None
+        radius = 0
+        while radius <= last_ring:
+            gathered.extend(self._ring(row, col, radius))
+            # Every point within this distance is guaranteed to be in the rings seen so far
+            covered = self._covered(row, radius)
+            if gathered:
+                ids = np.concatenate(gathered)
+                distances = haversine_meters(lat, lng, self.lats[ids], self.lngs[ids])
+                if len(ids) >= k and np.partition(distances, k - 1)[k - 1] <= covered:
+                    break
+            if max_meters is not None and covered >= max_meters:
+                break
+            radius += 1
+
+        if ids is None:
+            return []
+        if max_meters is not None:
+            keep = distances <= max_meters
+            ids, distances = ids[keep], distances[keep]
+        order = np.argsort(distances, kind="stable")[:k]
+        return [(int(ids[i]), float(distances[i])) for i in order]
@@ -0,0 +1,147 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from src.langgraphagenticai.utils.metrics import registry
+
+
+class PersistentTTLCache:
+    """
+    SQLite-backed key/value cache with per-entry TTL and stale-while-revalidate.
+    - fresh entries (younger than ttl) are returned directly
+    - stale entries (up to ttl + stale_ttl old) are returned immediately while a
+      background thread refreshes them
+    - anything older, or missing, is loaded synchronously
+    Values must be JSON-serializable. Loaders returning None, or values rejected
+    by the should_cache predicate, are not cached.
+    """
+    def __init__(self, path: str, ttl: float, stale_ttl: float = 0.0, name: str = "cache"):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.name = name
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        registry.register_cache(name, self)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._tasks = set()  # Strong references to async background refreshes
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL, ttl REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get_entry(self, key: str) -> Optional[tuple]:
+        """Return (value, age in seconds, ttl) or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at, ttl FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), time.time() - row[1], row[2]
+
+    def set(self, key: str, value: Any, ttl: float = None):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, stored_at, ttl) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), time.time(), self.ttl if ttl is None else ttl)
+            )
+            self._conn.commit()
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def _refresh(self, key: str, loader: Callable[[], Any], ttl: float, should_cache: Callable[[Any], bool]):
+        try:
+            value = loader()
+            if value is not None and should_cache(value):
+                self.set(key, value, ttl)
+        except Exception as e:
+            print(f"{self.name}: background refresh of {key} failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _start_refresh(self, key: str, loader: Callable[[], Any], ttl: float, should_cache: Callable[[Any], bool]):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        threading.Thread(target=self._refresh, args=(key, loader, ttl, should_cache), daemon=True).start()
+
+    def get_or_load(self, key: str, loader: Callable[[], Any], ttl: float = None,
+                    should_cache: Callable[[Any], bool] = lambda value: True, stale_ttl: float = None) -> Any:
+        """
+        Return the cached value for key, calling loader() when it is missing or expired.
+        ttl and stale_ttl override the cache-wide values for this kind of entry.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        stale_ttl = self.stale_ttl if stale_ttl is None else stale_ttl
+        entry = self.get_entry(key)
+        if entry is not None:
+            value, age, entry_ttl = entry
+            if age < entry_ttl:
+                self.hits += 1
+                return value
+            if age < entry_ttl + stale_ttl:
+                self.stale_hits += 1
+                self._start_refresh(key, loader, ttl, should_cache)
+                return value
+
+        self.misses += 1
+        value = loader()
+        if value is not None and should_cache(value):
+            self.set(key, value, ttl)
+        return value
+
+    async def _arefresh(self, key: str, loader: Callable[[], Awaitable[Any]], ttl: float, should_cache: Callable[[Any], bool]):
+        try:
+            value = await loader()
+            if value is not None and should_cache(value):
+                await asyncio.to_thread(self.set, key, value, ttl)
+        except Exception as e:
+            print(f"{self.name}: background refresh of {key} failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    async def aget_or_load(self, key: str, loader: Callable[[], Awaitable[Any]], ttl: float = None,
+                           should_cache: Callable[[Any], bool] = lambda value: True, stale_ttl: float = None) -> Any:
+        """
+        Async variant of get_or_load: loader is a coroutine function and stale
+        entries are refreshed in a task on the running event loop. SQLite reads and
+        writes run in a worker thread, since the loop is shared by every graph run.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        stale_ttl = self.stale_ttl if stale_ttl is None else stale_ttl
+        entry = await asyncio.to_thread(self.get_entry, key)
+        if entry is not None:
+            value, age, entry_ttl = entry
+            if age < entry_ttl:
+                self.hits += 1
+                return value
+            if age < entry_ttl + stale_ttl:
+                self.stale_hits += 1
+                with self._lock:
+                    start = key not in self._refreshing
+                    self._refreshing.add(key)
+                if start:
+                    task = asyncio.create_task(self._arefresh(key, loader, ttl, should_cache))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                return value
+
+        self.misses += 1
+        value = await loader()
+        if value is not None and should_cache(value):
+            await asyncio.to_thread(self.set, key, value, ttl)
+        return value
@@ -0,0 +1,55 @@
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+
+
+class VersionedJsonStore:
+    """
+    Base class for in-memory views over a JSON data file.
+    Subclasses implement _build() to turn the parsed data into a snapshot object.
+    The file is re-parsed only when its mtime changes and its content hash differs,
+    and the new snapshot replaces the old one in a single assignment so readers
+    never see a half-built set of views.
+    """
+    def __init__(self, data_file: Path, check_interval: float = 1.0):
+        self.data_file = Path(data_file)
+        self.check_interval = check_interval  # Seconds between mtime checks
+        self._lock = threading.Lock()
+        self._snapshot = self._build([], None)
+        self._mtime = None
+        self._last_check = 0.0
+
+    def _build(self, data, version):
+        raise NotImplementedError
+
+    def _current(self):
+        """
+        Return the current snapshot, reloading it first if the file has changed.
+        """
+        now = time.monotonic()
+        if self._mtime is not None and now - self._last_check < self.check_interval:
+            return self._snapshot
+
+        with self._lock:
+            mtime = self.data_file.stat().st_mtime_ns
+            self._last_check = now
+            if mtime != self._mtime:
+                raw = self.data_file.read_bytes()
+                version = hashlib.sha256(raw).hexdigest()
+                # A touched but unchanged file keeps the existing snapshot
+                if version != self._snapshot.version:
+                    self._snapshot = self._build(json.loads(raw), version)
+                self._mtime = mtime
+            return self._snapshot
+
+    def reload(self):
+        """Force the next access to re-check the data file."""
+        with self._lock:
+            self._mtime = None
+
+    @property
+    def version(self) -> str:
+        """Content hash of the currently loaded data file."""
+        return self._current().version
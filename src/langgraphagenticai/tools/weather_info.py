@@ -3,10 +3,158 @@ import dotenv
 from typing import Dict, Optional, List
 dotenv.load_dotenv()
 import os
+import sys
 import json
+import threading
+import time
 from pathlib import Path
 import requests
 
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent.parent
+sys.path.append(str(project_root))
+from src.langgraphagenticai.tools.restaurant_catalog import get_restaurant_catalog
+from src.langgraphagenticai.tools.http_client import get_http_client
+from src.langgraphagenticai.utils.metrics import registry
+
+OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
+
+
+class WeatherService:
+    """
+    Current-weather lookups bucketed on a coarse coordinate grid.
+    Restaurants in the same grid cell share one cached reading, and all cells
+    missing from the cache are fetched in a single multi-coordinate request.
+    """
+    def __init__(self, grid_degrees: float = 0.02, ttl: float = 600.0, timeout: float = 10.0):
+        self.grid_degrees = grid_degrees  # 0.02° is roughly 2 km in Munich
+        self.ttl = ttl
+        self.timeout = timeout
+        self._cache = {}  # bucket -> (fetched_at, current_weather)
+        self._lock = threading.Lock()
+        self.session = requests.Session()
+        self.hits = 0  # grid cells served from the cache
+        self.misses = 0
+        registry.register_cache("weather_cache", self)
+
+    def bucket(self, lat: float, lng: float) -> tuple:
+        return (round(lat / self.grid_degrees), round(lng / self.grid_degrees))
+
+    def _center(self, bucket: tuple) -> tuple:
+        return (round(bucket[0] * self.grid_degrees, 4), round(bucket[1] * self.grid_degrees, 4))
+
+    def _params(self, buckets: List[tuple]) -> Dict:
+        centers = [self._center(bucket) for bucket in buckets]
+        return {
+            "latitude": ",".join(str(center[0]) for center in centers),
+            "longitude": ",".join(str(center[1]) for center in centers),
+            "current_weather": "true",
+        }
+
+    def _parse(self, buckets: List[tuple], payload) -> Dict[tuple, Dict]:
+        # A single location returns an object, several locations return a list
+        results = payload if isinstance(payload, list) else [payload]
+        return {bucket: result["current_weather"] for bucket, result in zip(buckets, results)}
+
+    def _fetch(self, buckets: List[tuple]) -> Dict[tuple, Dict]:
+        """
+        Fetch current weather for all buckets with one Open-Meteo call.
+        """
+        resp = self.session.get(OPEN_METEO_URL, params=self._params(buckets), timeout=self.timeout)
+        resp.raise_for_status()
+        return self._parse(buckets, resp.json())
+
+    def _cached(self, buckets: Dict[str, tuple]) -> Dict[tuple, Dict]:
+        now = time.monotonic()
+        wanted = set(buckets.values())
+        with self._lock:
+            cached = {
+                bucket: entry[1] for bucket, entry in self._cache.items()
+                if bucket in wanted and now - entry[0] < self.ttl
+            }
+            self.hits += len(cached)
+            self.misses += len(wanted) - len(cached)
+        return cached
+
+    def _store(self, fetched: Dict[tuple, Dict]):
+        now = time.monotonic()
+        with self._lock:
+            # Drop expired cells so the cache (and the scan in _cached) stays small
+            for bucket in [bucket for bucket, entry in self._cache.items() if now - entry[0] >= self.ttl]:
+                del self._cache[bucket]
+            for bucket, weather in fetched.items():
+                self._cache[bucket] = (now, weather)
+
+    def get_many(self, positions: Dict[str, tuple]) -> Dict[str, Dict]:
+        """
+        Current weather for several named coordinates.
+        Args:
+            positions (Dict[str, tuple]): name -> (lat, lng)
+        Returns:
+            Dict[str, Dict]: name -> Open-Meteo current_weather
+        """
+        buckets = {name: self.bucket(lat, lng) for name, (lat, lng) in positions.items()}
+        cached = self._cached(buckets)
+        missing = sorted(set(buckets.values()) - set(cached))
+        if missing:
+            fetched = self._fetch(missing)
+            self._store(fetched)
+            cached.update(fetched)
+        return {name: cached[bucket] for name, bucket in buckets.items()}
+
+    async def aget_many(self, positions: Dict[str, tuple]) -> Dict[str, Dict]:
+        """
+        Async variant of get_many using the shared pooled HTTP client.
+        """
+        buckets = {name: self.bucket(lat, lng) for name, (lat, lng) in positions.items()}
+        cached = self._cached(buckets)
+        missing = sorted(set(buckets.values()) - set(cached))
+        if missing:
+            payload = await get_http_client().get_json(OPEN_METEO_URL, params=self._params(missing))
+            fetched = self._parse(missing, payload)
+            self._store(fetched)
+            cached.update(fetched)
+        return {name: cached[bucket] for name, bucket in buckets.items()}
+
+    def get(self, lat: float, lng: float) -> Dict:
+        return self.get_many({"location": (lat, lng)})["location"]
+
+
+weather_service = WeatherService(
+    grid_degrees=float(os.getenv("WEATHER_GRID_DEGREES", 0.02)),
+    ttl=float(os.getenv("WEATHER_CACHE_TTL", 600))
+)
+
+
+def _restaurant_positions(restaurant_names: List[str]) -> Dict[str, tuple]:
+    catalog = get_restaurant_catalog()
+    positions = {}
+    for name in restaurant_names:
+        restaurant = catalog.get(name)
+        if restaurant is None:
+            raise ValueError(f"Restaurant '{name}' not found")
+        position = restaurant.get('position') or {}
+        try:
+            positions[name] = (float(position.get('lat')), float(position.get('lng')))
+        except (TypeError, ValueError):
+            raise ValueError(f"Restaurant '{name}' has no coordinates")
+    return positions
+
+
+def _known_restaurant_positions(restaurant_names: List[str]) -> tuple:
+    """
+    Split restaurant names into positions of the located ones and an error entry per
+    name that is unknown or has no coordinates.
+    """
+    positions, errors = {}, {}
+    for name in restaurant_names:
+        try:
+            positions.update(_restaurant_positions([name]))
+        except ValueError as e:
+            errors[name] = {"error": str(e)}
+    return positions, errors
+
+
 def get_weather_for_restaurant(restaurant_name: str) -> Optional[Dict]:
     """
     Fetch weather or climate for a given restaurant.
@@ -16,26 +164,56 @@ def get_weather_for_restaurant(restaurant_name: str) -> Optional[Dict]:
         Optional[Dict]: The weather for the given restaurant.
     """
     try:
-        with open("data/sushi.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        position = None
-        for item in data:
-            if item.get('title') == restaurant_name:
-                position = item.get('position', {})
-                break
-        
-        url = "https://api.open-meteo.com/v1/forecast"
-        params = {
-            "latitude": float(position.get('lat')),
-            "longitude": float(position.get('lng')),
-            "current_weather": True,
-        }
-        
-        resp = requests.get(url, params=params)
-        resp.raise_for_status()
-        return resp.json()["current_weather"]
-        
+        return weather_service.get_many(_restaurant_positions([restaurant_name]))[restaurant_name]
+
+    except Exception as e:
+        print(f"Error fetching Weather: {str(e)}")
+        return None
+
+
+def get_weather_for_restaurants(restaurant_names: Optional[List[str]] = None) -> Optional[Dict]:
+    """
+    Fetch the current weather for several restaurants with at most one upstream call.
+    Args:
+        restaurant_names (List[str]): Restaurant names; all restaurants when empty.
+    Returns:
+        Optional[Dict]: Restaurant name -> current weather, or {"error": ...} for unknown names.
+    """
+    try:
+        names = restaurant_names or get_restaurant_catalog().names()
+        positions, errors = _known_restaurant_positions(names)
+        result = weather_service.get_many(positions) if positions else {}
+        result.update(errors)
+        return result
+
+    except Exception as e:
+        print(f"Error fetching Weather: {str(e)}")
+        return None
+
+async def aget_weather_for_restaurant(restaurant_name: str) -> Optional[Dict]:
+    """
+    Async variant of get_weather_for_restaurant.
+    """
+    try:
+        result = await weather_service.aget_many(_restaurant_positions([restaurant_name]))
+        return result[restaurant_name]
+
+    except Exception as e:
+        print(f"Error fetching Weather: {str(e)}")
+        return None
+
+
+async def aget_weather_for_restaurants(restaurant_names: Optional[List[str]] = None) -> Optional[Dict]:
+    """
+    Async variant of get_weather_for_restaurants.
+    """
+    try:
+        names = restaurant_names or get_restaurant_catalog().names()
+        positions, errors = _known_restaurant_positions(names)
+        result = await weather_service.aget_many(positions) if positions else {}
+        result.update(errors)
+        return result
+
     except Exception as e:
         print(f"Error fetching Weather: {str(e)}")
         return None
@@ -43,4 +221,5 @@ def get_weather_for_restaurant(restaurant_name: str) -> Optional[Dict]:
 # Example usage
 if __name__ == "__main__":
     result = get_weather_for_restaurant(restaurant_name="Sasou")
-    print(result)
\ No newline at end of file
+    print(result)
+    print(json.dumps(get_weather_for_restaurants(), indent=2))
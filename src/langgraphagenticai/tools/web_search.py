@@ -0,0 +1,109 @@
+import asyncio
+import dotenv
+from typing import Dict, List
+dotenv.load_dotenv()
+import os
+import re
+import sys
+import threading
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+from tavily import TavilyClient
+
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent.parent
+sys.path.append(str(project_root))
+from src.langgraphagenticai.tools.ttl_cache import PersistentTTLCache
+
+# Web results for the fallback path go stale quickly, keep them for an hour by default
+search_cache = PersistentTTLCache(
+    os.getenv("WEB_SEARCH_CACHE_PATH", str(project_root / ".cache" / "web_search.sqlite")),
+    ttl=float(os.getenv("WEB_SEARCH_CACHE_TTL", 3600)),
+    name="web_search_cache"
+)
+MAX_RESULTS = int(os.getenv("WEB_SEARCH_MAX_RESULTS", 5))
+QUERY_VARIANTS = int(os.getenv("WEB_SEARCH_VARIANTS", 1))
+
+_tavily_client = None
+_tavily_key = None
+_tavily_lock = threading.Lock()
+
+def get_tavily_client() -> TavilyClient:
+    """
+    Return a shared Tavily client, recreated only if the API key changes.
+    """
+    global _tavily_client, _tavily_key
+    api_key = os.getenv("TAVILY_API_KEY")
+    if not api_key:
+        raise ValueError("Tavily API key not found in environment variables")
+    with _tavily_lock:
+        if _tavily_client is None or _tavily_key != api_key:
+            _tavily_client = TavilyClient(api_key=api_key)
+            _tavily_key = api_key
+        return _tavily_client
+
+def normalize_query(query: str) -> str:
+    """
+    Cache key form of a query: lower case, no surrounding quotes, single spaces.
+    """
+    query = query.strip().strip('"\'').lower()
+    return re.sub(r"\s+", " ", query)
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical URL used to deduplicate results (no fragment, www. or trailing slash).
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    return urlunsplit((parts.scheme.lower(), host, parts.path.rstrip("/"), parts.query, ""))
+
+def web_search(query: str, max_results: int = MAX_RESULTS) -> List[Dict]:
+    """
+    Search the web with Tavily, serving repeated queries from the cache.
+    Args:
+        query (str): The search query
+        max_results (int): Maximum number of results
+    Returns:
+        List[Dict]: Tavily results (title, url, content, score, ...)
+    """
+    key = f"tavily:{max_results}:{normalize_query(query)}"
+    return search_cache.get_or_load(
+        key,
+        lambda: get_tavily_client().search(query=query, max_results=max_results).get("results", []),
+        should_cache=lambda results: len(results) > 0
+    )
+
+def dedupe_results(result_lists: List[List[Dict]]) -> List[Dict]:
+    """
+    Merge result lists, keeping the best-scored result per URL, best first.
+    """
+    best = {}
+    for results in result_lists:
+        for item in results:
+            url = item.get("url")
+            if not url:
+                continue
+            key = normalize_url(url)
+            if key not in best or item.get("score", 0) > best[key].get("score", 0):
+                best[key] = item
+    return sorted(best.values(), key=lambda item: item.get("score", 0), reverse=True)
+
+async def aweb_search_many(queries: List[str], max_results: int = MAX_RESULTS) -> List[Dict]:
+    """
+    Run several query variants concurrently and return the URL-deduplicated results.
+    A failing variant is skipped as long as at least one succeeds.
+    """
+    queries = list(dict.fromkeys(q for q in queries if q.strip()))
+    # The Tavily client is blocking; each variant runs in a worker thread
+    outcomes = await asyncio.gather(
+        *[asyncio.to_thread(web_search, query, max_results) for query in queries],
+        return_exceptions=True
+    )
+    result_lists = [outcome for outcome in outcomes if not isinstance(outcome, BaseException)]
+    if not result_lists and outcomes:
+        raise outcomes[0]
+    return dedupe_results(result_lists)
+
+# Example usage
+if __name__ == "__main__":
+    print(asyncio.run(aweb_search_many(["best sushi Munich", "sushi restaurant Munich reviews"])))
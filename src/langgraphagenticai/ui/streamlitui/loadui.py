@@ -1,23 +1,24 @@
 import streamlit as st
 import os
 from dotenv import load_dotenv
-import subprocess
-import sys
 load_dotenv()
 
 #Import the config file
 #from file location and name import class
 from src.langgraphagenticai.ui.uiconfigfile import Config
+from src.langgraphagenticai.ui.streamlitui.mcp_supervisor import get_mcp_supervisor
+from src.langgraphagenticai.tools.mcp_client import mcp_transport
 
 def start_mcp_servers():
-    # Get absolute paths to the MCP tool scripts
-    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../tools'))
-    parking_script = os.path.join(base_dir, 'mcp_parking.py')
-    restaurant_script = os.path.join(base_dir, 'mcp_restaurant.py')
-
-    # Start both as background processes (creationflags for Windows, close_fds for Unix)
-    subprocess.Popen([sys.executable, parking_script], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    subprocess.Popen([sys.executable, restaurant_script], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    """
+    Start (or reuse) the MCP servers and wait until they answer, so the first
+    message does not hit a server that is still booting. The supervisor keeps
+    restarting them if they crash and stops them when the app exits.
+    With MCP_TRANSPORT=inprocess the tools run inside the app and no server is started.
+    """
+    if mcp_transport() == "inprocess":
+        return True
+    return get_mcp_supervisor().start()
 
 # Start MCP servers when Streamlit app starts
 start_mcp_servers()
@@ -0,0 +1,248 @@
+import atexit
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent.parent.parent.parent
+sys.path.append(str(project_root))
+from src.langgraphagenticai.tools.mcp_client import MCP_CONNECTIONS
+
+TOOLS_DIR = project_root / "src" / "langgraphagenticai" / "tools"
+LOG_DIR = project_root / "logs"
+
+# MCP server name (as in MCP_CONNECTIONS) -> script serving it
+SERVER_SCRIPTS = {
+    "restaurant": TOOLS_DIR / "mcp_restaurant.py",
+    "Parking": TOOLS_DIR / "mcp_parking.py",
+}
+
+_INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "mcp-supervisor", "version": "1.0"},
+    },
+}
+_HEADERS = {"Accept": "application/json, text/event-stream"}
+
+
+class ManagedServer:
+    """One MCP server: its script, endpoint and, if we started it, its process."""
+    def __init__(self, name: str, script: Path, url: str):
+        self.name = name
+        self.script = script
+        self.url = url
+        self.port = urlsplit(url).port
+        self.process: Optional[subprocess.Popen] = None
+        self.external = False  # A healthy server we found already running and reuse
+        self.restarts = 0
+        self.failures = 0  # Consecutive failed health checks
+        self.backoff = 0.0
+        self.next_start = 0.0
+        self.started_at = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+
+class MCPSupervisor:
+    """
+    Starts the local MCP servers and keeps them available.
+    - a server already answering on its port (another Streamlit session, a
+      manual start) is reused instead of spawning a second one that cannot bind
+    - start() waits until every server answers an MCP initialize request
+    - a monitor thread restarts servers that exit or stop answering, with
+      exponential backoff so a server that crashes on start does not spin
+    - child output goes to logs/mcp_<name>.log and children are terminated at exit
+    """
+    def __init__(self, connections: Dict = MCP_CONNECTIONS, scripts: Dict = SERVER_SCRIPTS, log_dir: Path = LOG_DIR,
+                 ready_timeout: float = 30.0, check_interval: float = 5.0, max_backoff: float = 60.0,
+                 unhealthy_after: int = 3):
+        self.servers: List[ManagedServer] = [
+            ManagedServer(name, scripts[name], connection["url"])
+            for name, connection in connections.items() if name in scripts
+        ]
+        self.log_dir = Path(log_dir)
+        self.ready_timeout = ready_timeout
+        self.check_interval = check_interval
+        self.max_backoff = max_backoff
+        self.unhealthy_after = unhealthy_after
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+
+    def healthy(self, server: ManagedServer, timeout: float = 2.0) -> bool:
+        """True if the server completes an MCP initialize handshake."""
+        try:
+            with httpx.Client(timeout=timeout) as client:
+                resp = client.post(server.url, json=_INITIALIZE, headers=_HEADERS)
+                session_id = resp.headers.get("mcp-session-id")
+                if session_id:
+                    # Close the probe session so health checks do not pile up sessions on the server
+                    client.delete(server.url, headers={"mcp-session-id": session_id})
+                return resp.status_code == 200 and "serverInfo" in resp.text
+        except httpx.HTTPError:
+            return False
+
+    def _spawn(self, server: ManagedServer):
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        log_path = self.log_dir / f"mcp_{server.name.lower()}.log"
+        with open(log_path, "a", encoding="utf-8") as log:
+            log.write(f"\n--- starting {server.script.name} on port {server.port} at {time.strftime('%Y-%m-%d %H:%M:%S')} ---\n")
+            log.flush()
+            server.process = subprocess.Popen(
+                [sys.executable, str(server.script)],
+                stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL, cwd=str(project_root)
+            )
+        server.external = False
+        server.failures = 0
+        server.started_at = time.monotonic()
+        print(f"Started MCP server '{server.name}' (pid {server.process.pid}), log: {log_path}")
+
+    def _wait_ready(self, server: ManagedServer, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and not self._stop.is_set():
+            if self.healthy(server):
+                return True
+            if server.process is not None and server.process.poll() is not None:
+                return False  # Exited during start-up, e.g. the port is taken by something else
+            time.sleep(0.2)
+        return False
+
+    def start(self) -> bool:
+        """
+        Make every server available and start the monitor.
+        Returns True once all servers are ready, False if some were not ready
+        within ready_timeout (the monitor keeps retrying them).
+        """
+        with self._lock:
+            for server in self.servers:
+                if server.running or server.external:
+                    continue
+                if self.healthy(server):
+                    server.external = True
+                    print(f"Reusing MCP server '{server.name}' already running on port {server.port}")
+                else:
+                    self._spawn(server)
+
+            ready = True
+            deadline = time.monotonic() + self.ready_timeout
+            for server in self.servers:
+                if not self._wait_ready(server, max(0.0, deadline - time.monotonic())):
+                    ready = False
+                    print(f"MCP server '{server.name}' is not ready after {self.ready_timeout:.0f}s, see {self.log_dir}")
+                    self._schedule_restart(server)
+
+            if self._monitor is None:
+                self._monitor = threading.Thread(target=self._watch, name="mcp-supervisor", daemon=True)
+                self._monitor.start()
+            return ready
+
+    def _schedule_restart(self, server: ManagedServer):
+        server.backoff = min(self.max_backoff, server.backoff * 2 if server.backoff else 1.0)
+        server.next_start = time.monotonic() + server.backoff
+
+    def _terminate(self, server: ManagedServer, timeout: float = 5.0):
+        if server.running:
+            server.process.terminate()
+            try:
+                server.process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                server.process.kill()
+                server.process.wait()
+        server.process = None
+
+    def _check(self, server: ManagedServer):
+        now = time.monotonic()
+        if server.running or server.external:
+            if self.healthy(server):
+                server.failures = 0
+                # A server that stayed up for a while starts over with a short backoff
+                if server.backoff and now - server.started_at > self.max_backoff:
+                    server.backoff = 0.0
+                return
+            server.failures += 1
+            if server.failures < self.unhealthy_after:
+                return
+            print(f"MCP server '{server.name}' failed {server.failures} health checks, restarting")
+            self._terminate(server)
+            server.external = False
+            self._schedule_restart(server)
+        elif server.process is not None:
+            print(f"MCP server '{server.name}' exited with code {server.process.returncode}, restarting")
+            server.process = None
+            self._schedule_restart(server)
+
+        if now < server.next_start:
+            return
+        server.restarts += 1
+        if self.healthy(server):
+            server.external = True  # Someone else started it in the meantime
+            return
+        self._spawn(server)
+        if not self._wait_ready(server, self.ready_timeout):
+            self._terminate(server)
+            self._schedule_restart(server)
+            print(f"MCP server '{server.name}' restart {server.restarts} not ready, retrying in {server.backoff:.0f}s")
+
+    def _watch(self):
+        while not self._stop.wait(self.check_interval):
+            with self._lock:
+                for server in self.servers:
+                    if self._stop.is_set():
+                        return
+                    try:
+                        self._check(server)
+                    except Exception as e:
+                        print(f"MCP supervisor check of '{server.name}' failed: {e!r}")
+
+    def stop(self):
+        """Stop monitoring and terminate the servers this supervisor started."""
+        self._stop.set()
+        with self._lock:
+            for server in self.servers:
+                self._terminate(server)
+
+    def status(self) -> Dict[str, Dict]:
+        return {
+            server.name: {
+                "port": server.port,
+                "pid": server.process.pid if server.running else None,
+                "external": server.external,
+                "restarts": server.restarts,
+            }
+            for server in self.servers
+        }
+
+
+_supervisor = None
+_supervisor_lock = threading.Lock()
+
+
+def get_mcp_supervisor() -> MCPSupervisor:
+    """
+    Return the process-wide MCP supervisor; its children are terminated at exit.
+    MCP_READY_TIMEOUT and MCP_HEALTH_INTERVAL (seconds) tune it.
+    """
+    global _supervisor
+    if _supervisor is None:
+        with _supervisor_lock:
+            if _supervisor is None:
+                _supervisor = MCPSupervisor(
+                    ready_timeout=float(os.getenv("MCP_READY_TIMEOUT", 30)),
+                    check_interval=float(os.getenv("MCP_HEALTH_INTERVAL", 5)),
+                )
+                atexit.register(_supervisor.stop)
+    return _supervisor
@@ -1,5 +1,6 @@
 # This class is used to load the config file and get the options for the UI
 from configparser import ConfigParser
+import re
 import requests
 import os
 import streamlit as st
@@ -26,6 +27,19 @@ class Config:
     
     def get_chat_history_length(self):
         return self.config["DEFAULT"].get("CHAT_HISTORY_LENGTH")
+
+    #Per-model budget (HISTORY_TOKEN_BUDGET_<MODEL>, non-alphanumerics as "_"), then per provider
+    #(HISTORY_TOKEN_BUDGET_<PROVIDER>), then HISTORY_TOKEN_BUDGET
+    def get_history_token_budget(self, provider, model=None):
+        default = self.config["DEFAULT"].getint("HISTORY_TOKEN_BUDGET", fallback=6000)
+        budget = self.config["DEFAULT"].getint(f"HISTORY_TOKEN_BUDGET_{str(provider).upper()}", fallback=default)
+        if model:
+            model_key = re.sub(r"[^A-Z0-9]+", "_", str(model).upper()).strip("_")
+            budget = self.config["DEFAULT"].getint(f"HISTORY_TOKEN_BUDGET_{model_key}", fallback=budget)
+        return budget
+
+    def get_history_summary_tokens(self):
+        return self.config["DEFAULT"].getint("HISTORY_SUMMARY_TOKENS", fallback=400)
     
     def get_page_title(self):
         return self.config["DEFAULT"].get("PAGE_TITLE")
@@ -35,4 +49,13 @@ class Config:
     
     def get_ollama_model_options(self):
         return self.config["DEFAULT"].get("OLLAMA_MODEL_OPTIONS").split(", ")
-    
\ No newline at end of file
+
+    def get_enable_streaming(self):
+        return self.config["DEFAULT"].getboolean("ENABLE_STREAMING", fallback=False)
+
+    def get_enable_answer_cache(self):
+        return self.config["DEFAULT"].getboolean("ENABLE_ANSWER_CACHE", fallback=False)
+
+    #METRICS_PORT in the environment wins so deployments can enable metrics without editing the ini
+    def get_metrics_port(self):
+        return int(os.getenv("METRICS_PORT", self.config["DEFAULT"].get("METRICS_PORT", "0")))
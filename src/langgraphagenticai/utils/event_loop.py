@@ -0,0 +1,119 @@
+import asyncio
+import atexit
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Coroutine, Iterator
+
+_DONE = object()
+
+
+class BackgroundLoopRunner:
+    """
+    One asyncio event loop running forever in a daemon thread.
+    Sync code (Streamlit reruns, CLI entry points) submits coroutines to it, so
+    async clients, MCP sessions and HTTP pools created on the loop survive
+    across messages instead of dying with a per-call asyncio.run().
+    """
+    def __init__(self, name: str = "langgraph-event-loop"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedule a coroutine on the loop and return a concurrent Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: float = None) -> Any:
+        """
+        Run a coroutine on the background loop and block until it finishes.
+        Must not be called from the loop thread itself, which would deadlock.
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("BackgroundLoopRunner.run() called from its own event loop thread")
+        return self.submit(coro).result(timeout)
+
+    def iterate(self, agen: AsyncIterator, timeout: float = None) -> Iterator:
+        """
+        Consume an async iterator on the background loop and yield its items to the
+        calling thread as they arrive. Closing the generator early cancels the producer.
+        Args:
+            timeout (float): Maximum seconds to wait for each item
+        """
+        items = queue.Queue()
+
+        async def _pump():
+            try:
+                async for item in agen:
+                    items.put((item, None))
+            except BaseException as e:
+                items.put((_DONE, e))
+                raise
+            items.put((_DONE, None))
+
+        future = self.submit(_pump())
+        try:
+            while True:
+                item, error = items.get(timeout=timeout)
+                if item is _DONE:
+                    if error is not None:
+                        raise error
+                    return
+                yield item
+        finally:
+            if not future.done():
+                future.cancel()
+
+    def stop(self):
+        """Cancel outstanding tasks and stop the loop."""
+        if not self.loop.is_running():
+            return
+
+        async def _cancel_tasks():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            self.submit(_cancel_tasks()).result(5)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(5)
+
+
+_runner = None
+_runner_lock = threading.Lock()
+
+
+def get_loop_runner() -> BackgroundLoopRunner:
+    """
+    Return the process-wide background loop runner, starting it on first use.
+    Module state survives Streamlit reruns, so every rerun reuses the same loop.
+    """
+    global _runner
+    if _runner is None:
+        with _runner_lock:
+            if _runner is None:
+                _runner = BackgroundLoopRunner()
+                atexit.register(_runner.stop)
+    return _runner
+
+
+def run_async(coro: Coroutine, timeout: float = None) -> Any:
+    """
+    Run a coroutine to completion on the shared background loop.
+    """
+    return get_loop_runner().run(coro, timeout)
+
+
+def iterate_async(agen: AsyncIterator, timeout: float = None) -> Iterator:
+    """
+    Iterate an async generator from sync code via the shared background loop.
+    """
+    return get_loop_runner().iterate(agen, timeout)
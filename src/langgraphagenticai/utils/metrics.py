@@ -0,0 +1,284 @@
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+# Seconds; covers in-process tool calls (ms) up to slow LLM turns (a minute)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Counter:
+    """Monotonic counter with labels."""
+    kind = "counter"
+
+    def __init__(self, name: str, description: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+        return [f"{self.name}{_format_labels(self.labels, key)} {value:g}" for key, value in sorted(values.items())]
+
+
+class Histogram:
+    """Latency histogram with labels and fixed cumulative buckets."""
+    kind = "histogram"
+
+    def __init__(self, name: str, description: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple, list] = {}  # labels -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the with block; `status` is set to "error" if it raises."""
+        started = time.perf_counter()
+        status = "ok"
+        try:
+            yield
+        except BaseException:
+            status = "error"
+            raise
+        finally:
+            if "status" in self.labels:
+                labels.setdefault("status", status)
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            series = {key: list(values) for key, values in self._series.items()}
+        lines = []
+        for key, values in sorted(series.items()):
+            for bound, count in zip(self.buckets, values):
+                le = f'le="{bound:g}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, le)} {count}")
+            le = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, le)} {values[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {values[-2]:.6f}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {values[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    In-process metrics rendered in the Prometheus text format.
+    Caches register themselves and are read at scrape time from their own
+    hits/misses counters, so lookups pay nothing extra.
+    """
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._caches = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def _add(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, description: str, labels: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, description, labels))
+
+    def histogram(self, name: str, description: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, description, labels, buckets))
+
+    def register_cache(self, name: str, cache):
+        """Expose a cache's hits/misses (and stale_hits/semantic_hits if present) as cache_lookups_total."""
+        self._caches[name] = cache
+
+    def _cache_samples(self) -> List[str]:
+        lines = []
+        for name, cache in sorted(self._caches.items()):
+            for result in ("hits", "stale_hits", "semantic_hits", "misses", "skipped"):
+                if hasattr(cache, result):
+                    lines.append(f'cache_lookups_total{{cache="{_escape(name)}",result="{result}"}} {getattr(cache, result)}')
+        return lines
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines += metric.samples()
+        cache_lines = self._cache_samples()
+        if cache_lines:
+            lines.append("# HELP cache_lookups_total Cache lookups by result (semantic_hits are included in hits)")
+            lines.append("# TYPE cache_lookups_total counter")
+            lines += cache_lines
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+TURN_LATENCY = registry.histogram("chat_turn_duration_seconds", "End-to-end latency of a chat turn", ["usecase", "cached"])
+NODE_LATENCY = registry.histogram("graph_node_duration_seconds", "Latency of graph nodes (nested agent nodes as parent/child)", ["node", "status"])
+LLM_LATENCY = registry.histogram("llm_call_duration_seconds", "Latency of chat model calls", ["model", "status"])
+LLM_TOKENS = registry.counter("llm_tokens_total", "Tokens used by chat model calls", ["model", "kind"])
+TOOL_LATENCY = registry.histogram("tool_call_duration_seconds", "Latency of tool calls as seen by the agents", ["tool", "status"])
+MCP_CALL_LATENCY = registry.histogram("mcp_call_duration_seconds", "Latency of MCP tool calls per server", ["server", "status"])
+MCP_GET_TOOLS_LATENCY = registry.histogram("mcp_get_tools_duration_seconds", "Latency of loading the MCP tool list", ["status"])
+HTTP_LATENCY = registry.histogram("http_request_duration_seconds", "Latency of outbound HTTP requests", ["host", "status"])
+VECTOR_MEMORY_LATENCY = registry.histogram("vector_memory_duration_seconds", "Latency of Chroma searches and writes", ["operation", "status"])
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """
+    LangChain callback recording node, model and tool latency and token usage.
+    Pass it in the graph config ("callbacks") so nested agents and tools report too.
+    """
+    run_inline = True  # Timestamps must be taken on the calling thread, not in an executor
+
+    def __init__(self):
+        self._runs: Dict = {}  # run_id -> (histogram, labels, started)
+        self._lock = threading.Lock()
+
+    def _start(self, run_id, histogram: Histogram, **labels):
+        with self._lock:
+            self._runs[run_id] = (histogram, labels, time.perf_counter())
+
+    def _end(self, run_id, status: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._runs.pop(run_id, None)
+        if entry is None:
+            return None
+        histogram, labels, started = entry
+        histogram.observe(time.perf_counter() - started, status=status, **labels)
+        return labels
+
+    def on_chain_start(self, serialized, inputs, *, run_id, metadata=None, **kwargs):
+        metadata = metadata or {}
+        name = kwargs.get("name")
+        if name and name == metadata.get("langgraph_node"):
+            namespace = metadata.get("langgraph_checkpoint_ns", "")
+            node = "/".join(part.split(":")[0] for part in namespace.split("|") if part) or name
+            self._start(run_id, NODE_LATENCY, node=node)
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self._end(run_id, "ok")
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, "error")
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, **kwargs):
+        metadata = metadata or {}
+        model = metadata.get("ls_model_name") or (serialized or {}).get("name") or "unknown"
+        self._start(run_id, LLM_LATENCY, model=model)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        labels = self._end(run_id, "ok")
+        if labels is None:
+            return
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                for kind in ("input_tokens", "output_tokens"):
+                    if usage.get(kind):
+                        LLM_TOKENS.inc(usage[kind], model=labels["model"], kind=kind.split("_")[0])
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, "error")
+
+    def on_tool_start(self, serialized, input_str, *, run_id, **kwargs):
+        name = kwargs.get("name") or (serialized or {}).get("name") or "unknown"
+        self._start(run_id, TOOL_LATENCY, tool=name)
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        self._end(run_id, "ok")
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, "error")
+
+
+_handler = MetricsCallbackHandler()
+_enabled = False
+_server = None
+_server_lock = threading.Lock()
+
+
+def metrics_enabled() -> bool:
+    return _enabled
+
+
+def metrics_callbacks() -> list:
+    """Callbacks to add to a graph config: the metrics handler when metrics are enabled, else none."""
+    return [_handler] if _enabled else []
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes every few seconds would flood the console
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0"):
+    """
+    Enable the graph callbacks and serve /metrics in the Prometheus text format.
+    Safe to call on every Streamlit rerun; only the first call starts the server.
+    Args:
+        port (int): Port to listen on; 0 or less leaves metrics disabled
+        host (str): Interface to bind
+    """
+    global _server, _enabled
+    if port <= 0:
+        return None
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, port), _MetricsRequestHandler)
+            except OSError as e:
+                print(f"Metrics endpoint not started on port {port}: {e}")
+                return None
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+            print(f"Metrics available at http://{host}:{port}/metrics")
+        _enabled = True
+        return _server
@@ -0,0 +1,61 @@
+from typing import AsyncIterator, Dict, NamedTuple, Optional
+
+# Model calls whose tokens are the user-facing answer carry this tag; internal
+# calls (query generation, evaluation, storage decisions) stay silent
+ANSWER_TAG = "answer_stream"
+ANSWER_CONFIG = {"tags": [ANSWER_TAG]}
+
+
+class StreamUpdate(NamedTuple):
+    """
+    One incremental update from a running graph.
+    kind is "token", "tool_start", "tool_end", "node" or "final"; text holds the
+    token text, tool name or node name, and state the final graph output.
+    """
+    kind: str
+    text: str = ""
+    run_id: Optional[str] = None
+    state: Optional[Dict] = None
+
+
+def _top_level_node(metadata: Dict) -> Optional[str]:
+    # checkpoint_ns is "node:<id>" for graph nodes and "node:<id>|inner:<id>" inside subgraphs
+    namespace = metadata.get("langgraph_checkpoint_ns", "")
+    if not namespace or "|" in namespace:
+        return None
+    return namespace.split(":")[0]
+
+
+async def astream_graph(graph, initial_state: Dict, config: Optional[Dict] = None) -> AsyncIterator[StreamUpdate]:
+    """
+    Run a compiled graph and yield answer tokens and tool/node progress as they happen.
+    The last update is always kind="final" with the same state graph.ainvoke would return.
+    Args:
+        graph: Compiled LangGraph graph
+        initial_state (Dict): Input state
+        config (Dict): Runnable config (e.g. configurable session_id)
+    """
+    final_state = None
+    async for event in graph.astream_events(initial_state, config=config, version="v2"):
+        kind = event["event"]
+        if kind == "on_chat_model_stream":
+            if ANSWER_TAG not in event.get("tags", []):
+                continue
+            content = event["data"]["chunk"].content
+            if isinstance(content, list):
+                #Anthropic/Gemini style content blocks
+                content = "".join(block.get("text", "") if isinstance(block, dict) else str(block) for block in content)
+            if content:
+                yield StreamUpdate("token", content, event["run_id"])
+        elif kind == "on_tool_start":
+            yield StreamUpdate("tool_start", event["name"], event["run_id"])
+        elif kind == "on_tool_end":
+            yield StreamUpdate("tool_end", event["name"], event["run_id"])
+        elif kind == "on_chain_start":
+            node = _top_level_node(event.get("metadata", {}))
+            if node is not None and event["name"] == node:
+                yield StreamUpdate("node", node, event["run_id"])
+        elif kind == "on_chain_end" and not event.get("parent_ids"):
+            final_state = event["data"].get("output")
+
+    yield StreamUpdate("final", state=final_state)